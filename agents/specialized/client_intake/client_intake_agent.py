@@ -6,7 +6,6 @@ from datetime import datetime
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
-import json
 
 from core.agent_base import BaseAgent, Task
 from core.config_models import ClientIntakeAgentConfig
@@ -56,11 +55,7 @@ class ClientIntakeAgent(BaseAgent):
     async def _get_historical_metrics(self) -> Dict[str, Any]:
         """Get historical metrics for better estimation."""
         try:
-            metrics_file = self.feedback_system.data_dir / "agent_metrics_client_intake.json"
-            if metrics_file.exists():
-                with open(metrics_file, 'r') as f:
-                    return json.load(f)
-            return {}
+            return self.feedback_system.get_agent_metrics("client_intake")
         except Exception as e:
             logger.error(f"Failed to load historical metrics: {e}")
             return {}
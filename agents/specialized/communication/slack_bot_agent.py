@@ -1,7 +1,7 @@
 """Slack Bot agent for handling Slack communications."""
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from datetime import datetime
 from loguru import logger
 from rich.console import Console
@@ -10,7 +10,7 @@ from rich.table import Table
 from core.agent_base import BaseAgent, Task
 from core.config_models import SlackBotAgentConfig
 from core.exceptions import FatalError
-from core.agent_orchestrator import TaskDependency
+from core.agent_orchestrator import TaskDependency, SlackNotifyPayload
 from core.feedback_system import FeedbackSystem, MilestoneStatus
 
 class SlackBotAgent(BaseAgent):
@@ -312,8 +312,11 @@ This document outlines the Slack message content and metadata.
         self.console.print(table)
         self.logger.info(f"Sent notification to {channel}: {message}")
 
-    async def run_task(self, task: Task) -> Dict[str, Any]:
-        """Execute Slack communication tasks."""
+    async def run_task(self, task: Union[Task, SlackNotifyPayload]) -> Dict[str, Any]:
+        """Execute Slack communication tasks.
+        
+        Accepts the orchestrator's lean ``SlackNotifyPayload`` as well as a full ``Task``.
+        """
         self.log_task_start(task)
         start_time = datetime.now()
 
@@ -381,7 +384,48 @@ This document outlines the Slack message content and metadata.
                 
                 return {"status": "success", "message": "Delay notification sent"}
 
-            # Case 3: Send general notification
+            # Case 3: Send a batch of milestone and delay notifications, one message per channel
+            if task.metadata.get("type") == "notification_batch":
+                notifications = task.metadata.get("notifications")
+                if not notifications:
+                    raise ValueError("No notifications provided")
+                    
+                messages_by_channel: Dict[str, List[str]] = {}
+                for notification in notifications:
+                    milestone = notification["milestone"]
+                    if notification.get("type") == "delay_notification":
+                        channel = self.notification_channels.get("alerts", "general")
+                        message = self._format_delay_message(milestone, notification["delay_reason"])
+                    else:
+                        channel = self.notification_channels.get("milestones", "general")
+                        message = self._format_milestone_message(milestone)
+                    messages_by_channel.setdefault(channel, []).append(message)
+                    
+                # Send to Slack
+                for channel, messages in messages_by_channel.items():
+                    message = "\n".join(messages)
+                    await self.slack_bot.send_message(channel, message)
+                    self._log_notification(channel, message)
+                    
+                # Record task completion
+                completion = TaskCompletion(
+                    task_id=task.task_id,
+                    agent_id=self.agent_id,
+                    estimated_duration=task.metadata.get("estimated_duration", 0),
+                    actual_duration=(datetime.now() - start_time).total_seconds(),
+                    start_time=start_time,
+                    end_time=datetime.now(),
+                    complexity=task.metadata.get("complexity", 1),
+                    dependencies=task.metadata.get("dependencies", []),
+                    success=True,
+                    notes=f"Sent {len(notifications)} batched notifications"
+                )
+                
+                await self.feedback_system.record_task_completion(completion)
+                
+                return {"status": "success", "message": f"Sent {len(notifications)} notifications"}
+
+            # Case 4: Send general notification
             message = task.metadata.get("message")
             channel = task.metadata.get("channel", "general")
             
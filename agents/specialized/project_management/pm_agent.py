@@ -301,11 +301,7 @@ class ProjectManagerAgent(BaseAgent):
     async def get_agent_performance_metrics(self, agent_id: str) -> Dict[str, Any]:
         """Get performance metrics for a specific agent."""
         try:
-            metrics_file = self.feedback_system.data_dir / f"agent_metrics_{agent_id}.json"
-            if metrics_file.exists():
-                with open(metrics_file, 'r') as f:
-                    return json.load(f)
-            return {}
+            return self.feedback_system.get_agent_metrics(agent_id)
         except Exception as e:
             logger.error(f"Failed to load agent metrics: {e}")
             return {}
@@ -6,7 +6,6 @@ from datetime import datetime, timedelta
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
-import json
 import asyncio
 from collections import defaultdict
 
@@ -47,18 +46,16 @@ class TimelineEstimatorAgent(BaseAgent):
         """Load historical throughput data from feedback system."""
         try:
             for agent_id in self.config.agent_ids:
-                metrics_file = self.feedback_system.data_dir / f"agent_metrics_{agent_id}.json"
-                if metrics_file.exists():
-                    with open(metrics_file, 'r') as f:
-                        metrics = json.load(f)
-                        if "completion_times" in metrics:
-                            # Calculate average duration and throughput
-                            durations = [t["duration"] for t in metrics["completion_times"]]
-                            if durations:
-                                self.agent_throughput[agent_id]["average_duration"] = sum(durations) / len(durations)
-                                self.agent_throughput[agent_id]["tasks_per_minute"] = 60 / self.agent_throughput[agent_id]["average_duration"]
-                                self.agent_throughput[agent_id]["total_tasks"] = len(durations)
-                                self.agent_throughput[agent_id]["last_update"] = datetime.now().isoformat()
+                metrics = self.feedback_system.get_agent_metrics(agent_id)
+                if "completion_times" in metrics:
+                    # Calculate average duration and throughput; entries
+                    # recorded before durations were logged don't have one
+                    durations = [t["duration"] for t in metrics["completion_times"] if "duration" in t]
+                    if durations:
+                        self.agent_throughput[agent_id]["average_duration"] = sum(durations) / len(durations)
+                        self.agent_throughput[agent_id]["tasks_per_minute"] = 60 / self.agent_throughput[agent_id]["average_duration"]
+                        self.agent_throughput[agent_id]["total_tasks"] = len(durations)
+                        self.agent_throughput[agent_id]["last_update"] = datetime.now().isoformat()
         except Exception as e:
             logger.error(f"Failed to load historical throughput: {e}")
             
@@ -9,6 +9,21 @@ from loguru import logger
 if TYPE_CHECKING:
     from .config import ConfigLoader, SystemConfig
 
+_SYSTEM_ROLE = "system"
+_USER_ROLE = "user"
+
+_ANALYZE_SYSTEM_MESSAGE = "You are a code analysis expert. Analyze the provided code and return a structured analysis."
+_IMPROVE_SYSTEM_MESSAGE = "You are a code improvement expert. Provide specific, actionable suggestions for improving the code."
+
+def _mk_messages(system_message: Optional[str], prompt: str) -> tuple:
+    """Build the chat message sequence for a single prompt."""
+    if system_message:
+        return (
+            {"role": _SYSTEM_ROLE, "content": system_message},
+            {"role": _USER_ROLE, "content": prompt},
+        )
+    return ({"role": _USER_ROLE, "content": prompt},)
+
 class LLMInterface:
     """Interface for interacting with language models."""
     
@@ -65,14 +80,9 @@ class LLMInterface:
             Generated response text
         """
         try:
-            messages = []
-            if system_message:
-                messages.append({"role": "system", "content": system_message})
-            messages.append({"role": "user", "content": prompt})
-            
             response = await self.client.chat.completions.create(
                 model=model,
-                messages=messages,
+                messages=_mk_messages(system_message, prompt),
                 temperature=temperature,
                 max_tokens=max_tokens
             )
@@ -98,13 +108,14 @@ class LLMInterface:
             Analysis results
         """
         try:
-            prompt = f"Analyze the following code:\n\n{code}"
             if context:
-                prompt = f"Context: {context}\n\n{prompt}"
+                prompt = f"Context: {context}\n\nAnalyze the following code:\n\n{code}"
+            else:
+                prompt = f"Analyze the following code:\n\n{code}"
                 
             response = await self.generate_response(
                 prompt=prompt,
-                system_message="You are a code analysis expert. Analyze the provided code and return a structured analysis.",
+                system_message=_ANALYZE_SYSTEM_MESSAGE,
                 temperature=0.3
             )
             
@@ -130,13 +141,14 @@ class LLMInterface:
             List of improvement suggestions
         """
         try:
-            prompt = f"Suggest improvements for the following code:\n\n{code}"
             if analysis:
-                prompt = f"Previous analysis: {analysis}\n\n{prompt}"
+                prompt = f"Previous analysis: {analysis}\n\nSuggest improvements for the following code:\n\n{code}"
+            else:
+                prompt = f"Suggest improvements for the following code:\n\n{code}"
                 
             response = await self.generate_response(
                 prompt=prompt,
-                system_message="You are a code improvement expert. Provide specific, actionable suggestions for improving the code.",
+                system_message=_IMPROVE_SYSTEM_MESSAGE,
                 temperature=0.5
             )
             
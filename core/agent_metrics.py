@@ -1,12 +1,14 @@
 """Enhanced monitoring system with rolling metrics and trend analysis."""
 
 import os
+import sys
 import json
-from datetime import datetime, timedelta
+import threading
+import weakref
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from collections import defaultdict
-import pandas as pd
 import numpy as np
 from loguru import logger
 from dotenv import load_dotenv
@@ -15,6 +17,11 @@ from dotenv import load_dotenv
 if TYPE_CHECKING:
     from .config import ConfigLoader, SystemConfig
 
+def _last_n_days(n: int) -> List[date]:
+    """Return the last ``n`` calendar days, oldest first, ending today."""
+    today = datetime.now().date()
+    return [today - timedelta(days=i) for i in range(n - 1, -1, -1)]
+
 class MetricsCollector:
     """Collects and analyzes agent performance metrics."""
     
@@ -22,7 +29,8 @@ class MetricsCollector:
         self,
         config: Optional['ConfigLoader'] = None,
         log_dir: Optional[str] = None,
-        metrics_dir: Optional[str] = None
+        metrics_dir: Optional[str] = None,
+        flush_interval: float = 1.0
     ):
         """Initialize metrics collector.
         
@@ -30,6 +38,7 @@ class MetricsCollector:
             config: Optional configuration loader
             log_dir: Optional directory for logs
             metrics_dir: Optional directory for metrics
+            flush_interval: Seconds between background flushes of recorded metrics
         """
         load_dotenv()
         self.config = config
@@ -53,6 +62,21 @@ class MetricsCollector:
         # Load existing metrics
         self._load_metrics()
         
+        # Recorded metrics are persisted by a background flusher rather than on every record
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._stop_event = threading.Event()
+        self._flusher_thread = threading.Thread(
+            target=self._flusher,
+            args=(weakref.ref(self), self._stop_event, flush_interval),
+            name="metrics-flusher",
+            daemon=True
+        )
+        self._flusher_thread.start()
+        # Flushes at interpreter exit without keeping the collector alive until then
+        self._finalizer = weakref.finalize(self, self._finalize, weakref.ref(self), self._stop_event)
+        
     def _load_metrics(self):
         """Load existing metrics from storage."""
         metrics_file = self.metrics_dir / "metrics.json"
@@ -69,16 +93,53 @@ class MetricsCollector:
     def _save_metrics(self):
         """Save metrics to storage."""
         metrics_file = self.metrics_dir / "metrics.json"
+        tmp_file = metrics_file.with_name(metrics_file.name + ".tmp")
         try:
-            with open(metrics_file, 'w') as f:
-                json.dump({
-                    'daily': dict(self.daily_metrics),
-                    'rolling': dict(self.rolling_metrics),
-                    'agents': dict(self.agent_metrics)
-                }, f)
+            with self._lock:
+                with open(tmp_file, 'w') as f:
+                    json.dump({
+                        'daily': dict(self.daily_metrics),
+                        'rolling': dict(self.rolling_metrics),
+                        'agents': dict(self.agent_metrics)
+                    }, f)
+                os.replace(tmp_file, metrics_file)
+                self._dirty = False
         except Exception as e:
             logger.error(f"Error saving metrics: {e}")
             
+    @staticmethod
+    def _flusher(ref, stop_event, interval):
+        """Periodically persist metrics that were recorded since the last save.
+        
+        The collector is only held between waits, so an unclosed one can
+        still be garbage collected.
+        """
+        while not stop_event.wait(interval):
+            collector = ref()
+            if collector is None:
+                return
+            collector.flush()
+            del collector
+            
+    @staticmethod
+    def _finalize(ref, stop_event):
+        """Stop the flusher, persisting pending metrics if the collector is still alive."""
+        stop_event.set()
+        collector = ref()
+        if collector is not None:
+            collector.flush()
+                
+    def flush(self):
+        """Persist pending metrics immediately."""
+        if self._dirty:
+            self._save_metrics()
+            
+    def close(self):
+        """Stop the background flusher and persist any pending metrics."""
+        self._finalizer.detach()
+        self._stop_event.set()
+        self.flush()
+            
     def collect_daily_metrics(self):
         """Collect metrics from today's logs."""
         today = datetime.now().date()
@@ -113,6 +174,8 @@ class MetricsCollector:
     def _process_log_entry(self, agent_id: str, log_entry: Dict[str, Any]):
         """Process a single log entry and update metrics."""
         today = datetime.now().date().isoformat()
+        # Share one key object per agent across all nested per-day dicts
+        agent_id = sys.intern(agent_id)
         
         # Basic metrics
         self.daily_metrics[today]['total_tasks'].append(1)
@@ -140,15 +203,12 @@ class MetricsCollector:
         
     def _update_rolling_metrics(self):
         """Update rolling metrics for the past 7 days."""
-        today = datetime.now().date()
-        cutoff_date = today - timedelta(days=7)
-        
         # Clear old rolling metrics
         self.rolling_metrics.clear()
         
         # Aggregate metrics for the past 7 days
-        for date in pd.date_range(cutoff_date, today):
-            date_str = date.date().isoformat()
+        for day in _last_n_days(8):
+            date_str = day.isoformat()
             if date_str not in self.daily_metrics:
                 continue
                 
@@ -187,8 +247,8 @@ class MetricsCollector:
             
         # Calculate daily velocities
         daily_velocities = []
-        for date in pd.date_range(datetime.now().date() - timedelta(days=7), datetime.now().date()):
-            date_str = date.date().isoformat()
+        for day in _last_n_days(8):
+            date_str = day.isoformat()
             if date_str in self.daily_metrics:
                 daily_velocities.append(len(self.daily_metrics[date_str]['completed_tasks']))
                 
@@ -213,27 +273,25 @@ class MetricsCollector:
         if total == 0:
             return {'current_rate': 0, 'trend': 0}
             
-        # Calculate daily error rates
-        daily_rates = []
-        for date in pd.date_range(datetime.now().date() - timedelta(days=7), datetime.now().date()):
-            date_str = date.date().isoformat()
-            if date_str in self.daily_metrics:
-                daily_total = len(self.daily_metrics[date_str]['total_tasks'])
-                daily_failed = len(self.daily_metrics[date_str]['failed_tasks'])
-                if daily_total > 0:
-                    daily_rates.append(daily_failed / daily_total)
-                    
-        if not daily_rates:
+        # Calculate daily error rates over the days that saw any tasks
+        days = [self.daily_metrics.get(day.isoformat(), {}) for day in _last_n_days(8)]
+        totals = np.fromiter((len(d.get('total_tasks', ())) for d in days), dtype=np.int64, count=len(days))
+        fails = np.fromiter((len(d.get('failed_tasks', ())) for d in days), dtype=np.int64, count=len(days))
+        active = totals > 0
+        if not active.any():
             return {'current_rate': 0, 'trend': 0}
             
-        # Calculate trend
-        x = np.arange(len(daily_rates))
-        slope = np.polyfit(x, daily_rates, 1)[0]
+        daily_rates = fails[active] / totals[active]
+        
+        # Calculate trend (closed-form least-squares slope)
+        x = np.arange(daily_rates.size) - (daily_rates.size - 1) / 2
+        denom = (x * x).sum()
+        slope = float((x * (daily_rates - daily_rates.mean())).sum() / denom) if denom else 0.0
         
         return {
             'current_rate': failed / total,
             'trend': slope,
-            'daily_rates': daily_rates
+            'daily_rates': daily_rates.tolist()
         }
         
     def _calculate_retry_efficiency(self) -> Dict[str, float]:
@@ -246,8 +304,8 @@ class MetricsCollector:
             
         # Calculate retry success rate
         retry_success = 0
-        for date in pd.date_range(datetime.now().date() - timedelta(days=7), datetime.now().date()):
-            date_str = date.date().isoformat()
+        for day in _last_n_days(8):
+            date_str = day.isoformat()
             if date_str in self.daily_metrics:
                 for log_entry in self.daily_metrics[date_str].get('log_entries', []):
                     if log_entry.get('retry_count', 0) > 0 and log_entry.get('status') == 'completed':
@@ -331,11 +389,10 @@ class MetricsCollector:
             'retry_strategy': retry_strategy_used
         }
         
-        # Process the log entry
-        self._process_log_entry(agent_name, log_entry)
-        
-        # Save metrics
-        self._save_metrics()
+        # Process the log entry; the background flusher persists it
+        with self._lock:
+            self._process_log_entry(agent_name, log_entry)
+            self._dirty = True
 
 # Global metrics collector instance
 metrics_collector = MetricsCollector()
@@ -1,17 +1,23 @@
 """Agent orchestrator for coordinating agent interactions and task management."""
 
 import os
+import sys
 import yaml
 import asyncio
 import time
 import uuid
-import json
-from typing import Dict, Any, List, Type, Optional, Set, TYPE_CHECKING
+import itertools
+from collections import defaultdict, Counter
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Dict, DefaultDict, Any, List, Tuple, Type, Optional, Set, TYPE_CHECKING
 from loguru import logger
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from datetime import datetime
+from rich.live import Live
+from datetime import datetime, timedelta
+from pathlib import Path
 
 # Type checking imports to avoid circular dependencies
 if TYPE_CHECKING:
@@ -25,36 +31,87 @@ if TYPE_CHECKING:
 # Runtime imports
 from .exceptions import TransientError, FatalError, PEPPERError, AgentError
 from .agent_metrics import record_metric
+from .json_utils import dump_json, load_json
 
+BACKOFF_STRATEGIES = ("exponential", "linear", "fixed")
+
+# Seconds to wait after a milestone change before writing milestones.json, so bursts coalesce
+MILESTONE_FLUSH_DELAY = 0.25
+
+# Slack notifications are collected for this many seconds and sent as one batch
+NOTIFICATION_FLUSH_DELAY = 0.25
+NOTIFICATION_BATCH_SIZE = 20
+
+@dataclass(slots=True)
 class TaskDependency:
     """Represents a task dependency with metadata."""
     
-    def __init__(self, task_id: str, agent_id: str, description: str, 
-                 depends_on: List[str] = None, metadata: Dict[str, Any] = None):
-        self.task_id = task_id
-        self.agent_id = agent_id
-        self.description = description
-        self.depends_on = depends_on or []
-        self.metadata = metadata or {}
-        self.status = "pending"
-        self.start_time = None
-        self.end_time = None
-        self.result = None
+    task_id: str
+    agent_id: str
+    description: str
+    depends_on: Optional[List[str]] = field(default_factory=list)
+    metadata: Optional[Dict[str, Any]] = field(default_factory=dict)
+    status: str = "pending"
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    result: Optional[Dict[str, Any]] = None
+    # Resolved once at creation so the scheduler doesn't re-read metadata per run
+    agent_ref: Optional['BaseAgent'] = field(default=None, init=False, repr=False, compare=False)
+    estimated_duration: float = field(default=0, init=False, repr=False, compare=False)
+    complexity: int = field(default=5, init=False, repr=False, compare=False)
+    milestone_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # get_task_status() result, dropped whenever the status changes
+    _status_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Callers pass None explicitly for "no dependencies" / "no metadata"
+        if self.depends_on is None:
+            self.depends_on = []
+        if self.metadata is None:
+            self.metadata = {}
+        self.estimated_duration = self.metadata.get("estimated_duration", 0)
+        self.complexity = self.metadata.get("complexity", 5)
+        self.milestone_id = self.metadata.get("milestone_id") or None
+
+@dataclass(slots=True)
+class SlackNotifyPayload:
+    """Lightweight task handed to the Slack bot for orchestrator notifications.
+    
+    Carries only what ``SlackBotAgent.run_task`` reads and sets, so internal
+    notifications skip building and validating a full ``Task`` model.
+    """
+    
+    task_id: str
+    description: str
+    metadata: Dict[str, Any]
+    task_type: str = "slack_bot"
+    status: str = "pending"
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
 
+@dataclass(slots=True)
 class RetryStrategy:
     """Configuration for retry behavior."""
     
-    def __init__(
-        self,
-        max_retries: int = 3,
-        base_delay: float = 1.0,
-        max_delay: float = 32.0,
-        strategy: str = "exponential"
-    ):
-        self.max_retries = max_retries
-        self.base_delay = base_delay
-        self.max_delay = max_delay
-        self.strategy = strategy
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 32.0
+    strategy: str = "exponential"
+    _delays: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.strategy not in BACKOFF_STRATEGIES:
+            raise ValueError(
+                f"Unknown backoff strategy: {self.strategy} "
+                f"(expected one of {', '.join(BACKOFF_STRATEGIES)})"
+            )
+        # Delays for attempts 1..max_retries are fixed per strategy, so compute them once
+        self._delays = tuple(
+            self._compute_delay(attempt)
+            for attempt in range(1, max(self.max_retries, 1) + 1)
+        )
         
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> 'RetryStrategy':
@@ -66,55 +123,91 @@ class RetryStrategy:
             strategy=config.get("backoff_strategy", "exponential")
         )
         
-    def calculate_delay(self, attempt: int) -> float:
-        """Calculate delay based on strategy."""
+    def _compute_delay(self, attempt: int) -> float:
+        """Compute the delay for an attempt from the strategy parameters."""
         if self.strategy == "exponential":
-            delay = min(
+            return min(
                 self.base_delay * (2 ** (attempt - 1)),
                 self.max_delay
             )
-        elif self.strategy == "linear":
-            delay = min(
+        if self.strategy == "linear":
+            return min(
                 self.base_delay * attempt,
                 self.max_delay
             )
-        elif self.strategy == "fixed":
-            delay = self.base_delay
-        else:
-            logger.warning(f"Unknown backoff strategy: {self.strategy}, using exponential")
-            delay = min(
-                self.base_delay * (2 ** (attempt - 1)),
-                self.max_delay
-            )
-        return delay
+        return self.base_delay
+        
+    def calculate_delay(self, attempt: int) -> float:
+        """Calculate delay based on strategy."""
+        if 0 < attempt <= len(self._delays):
+            return self._delays[attempt - 1]
+        return self._compute_delay(attempt)
 
 class AgentOrchestrator:
     """Coordinates agent interactions and manages task execution."""
     
-    def __init__(self, config_path: str = "config/project_config.yaml"):
+    def __init__(self, config_path: str = "config/project_config.yaml", verbose: bool = False):
         """Initialize the orchestrator.
         
         Args:
             config_path: Path to the project configuration file
+            verbose: Whether to show a live table of per-task activity
         """
         self.config_path = config_path
+        self.verbose = verbose
         self.config_loader = ConfigLoader(config_dir=os.path.dirname(config_path))
         self.config = self._load_config()
         self.agents: Dict[str, 'BaseAgent'] = {}
         self.router = TaskRouter()
         self.tasks: Dict[str, TaskDependency] = {}
         self.completed_tasks: Dict[str, TaskDependency] = {}
+        self._inter_task_counter = itertools.count()
+        
+        # Status tallies of the tasks in self.tasks, overall and per agent
+        self._task_status_counts: Counter = Counter()
+        self._agent_task_counts: DefaultDict[str, Counter] = defaultdict(Counter)
         self.console = Console()
+        self._task_table: Optional[Table] = None
+        self._live: Optional[Live] = None
         self.feedback_system = FeedbackSystem(None, None)  # Will be initialized later
         self.milestones: Dict[str, 'MilestoneStatus'] = {}
+        self._milestone_dirty = asyncio.Event()
+        # Milestones changed since the last save, and the encoded JSON of every other one
+        self._dirty_milestones: Set[str] = set()
+        self._milestone_fragments: Dict[str, bytes] = {}
+        # milestone.dict() results, shared by notifications and saves until the milestone changes
+        self._milestone_dicts: Dict[str, Dict[str, Any]] = {}
+        # Flushes come from the background loop and from delay handling; one at a time
+        self._milestone_write_lock = asyncio.Lock()
+        
+        # Pending Slack notifications, sent in batches by a background task
+        self._notification_queue: asyncio.Queue = asyncio.Queue()
+        self._notification_flusher: Optional[asyncio.Task] = None
+        self._milestone_flusher: Optional[asyncio.Task] = None
+        # Save started by the background loop; shielded so stopping the loop can't abandon its write
+        self._milestone_flush: Optional[asyncio.Task] = None
         
         # Task dependency tracking
-        self.task_dependencies: Dict[str, Set[str]] = {}
-        self.reverse_dependencies: Dict[str, Set[str]] = {}
+        self.task_dependencies: DefaultDict[str, Set[str]] = defaultdict(set)
+        self.reverse_dependencies: DefaultDict[str, Set[str]] = defaultdict(set)
+        
+        # Per-task count of unfinished dependencies and the queue of tasks that reached zero
+        self.remaining_deps: Dict[str, int] = {}
+        self.ready_queue: asyncio.Queue = asyncio.Queue()
+        
+        # Per-agent work queues, each drained by its own worker
+        self.agent_queues: Dict[str, asyncio.Queue] = {}
+        self._workers: List[asyncio.Task] = []
+        
+        # Set whenever a task becomes ready or finishes, so the scheduler can wake up
+        self._progress = asyncio.Event()
+        self._running = 0
         
         # Default retry configuration
         self.default_retry_strategy = RetryStrategy()
-        self.transient_errors: Dict[Type[Exception], int] = {
+        self._retry_strategies: Dict[str, RetryStrategy] = {}
+        self._retry_count_cache: Dict[Type[BaseException], int] = {}
+        self.transient_errors = {
             TransientError: 3,
             ConnectionError: 3,
             TimeoutError: 3,
@@ -124,6 +217,16 @@ class AgentOrchestrator:
         
         self._setup_logging()
         
+    @property
+    def transient_errors(self) -> Dict[Type[Exception], int]:
+        """Retry budget per transient exception type."""
+        return self._transient_errors
+        
+    @transient_errors.setter
+    def transient_errors(self, errors: Dict[Type[Exception], int]) -> None:
+        self._transient_errors = dict(errors)
+        self._retry_count_cache.clear()
+        
     def _setup_logging(self) -> None:
         """Set up logging configuration."""
         logger.remove()  # Remove default handler
@@ -135,12 +238,12 @@ class AgentOrchestrator:
             level="INFO",
             rotation="500 MB",
             retention="10 days",
-            colorize=True
+            colorize=False
         )
         
-        # Console handler with colors
+        # Console handler with colors; loguru formats and writes from its own queue thread
         logger.add(
-            lambda msg: self.console.print(msg, markup=True),
+            sys.stderr,
             format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
             level="INFO",
             colorize=True,
@@ -189,14 +292,15 @@ class AgentOrchestrator:
         # Initialize feedback system
         await self.feedback_system.initialize()
         
-        # Load existing milestones
+        # Load existing milestones without blocking the event loop
         milestone_file = self.feedback_system.data_dir / "milestones.json"
-        if milestone_file.exists():
-            with open(milestone_file, 'r') as f:
-                milestone_data = json.load(f)
-                for milestone in milestone_data:
-                    self.milestones[milestone["milestone_id"]] = MilestoneStatus(**milestone)
+        for milestone in await asyncio.to_thread(self._read_milestones, milestone_file):
+            self.milestones[milestone["milestone_id"]] = MilestoneStatus(**milestone)
                     
+        # Persist milestone changes in the background
+        if self._milestone_flusher is None:
+            self._milestone_flusher = asyncio.create_task(self._milestone_flush_loop())
+            
         # Load agent configurations
         agent_configs = self.config.get("agents", {})
         for agent_id, config in agent_configs.items():
@@ -208,7 +312,8 @@ class AgentOrchestrator:
                 logger.warning(f"Unknown agent type: {agent_type}")
                 
         # Load tasks from config
-        self.tasks = {task.task_id: task for task in self.config.get("tasks", [])}
+        for task in self.config.get("tasks", []):
+            self._register_task(task)
         logger.info(f"Loaded {len(self.tasks)} tasks from config")
         
         # Display available agents
@@ -249,29 +354,20 @@ class AgentOrchestrator:
             metadata=metadata
         )
         
-        # Add to task queue
-        self.tasks[task_id] = task
-        
-        # Update dependency tracking
-        self.task_dependencies[task_id] = set(dependencies or [])
-        for dep in dependencies:
-            if dep not in self.reverse_dependencies:
-                self.reverse_dependencies[dep] = set()
-            self.reverse_dependencies[dep].add(task_id)
+        # Add to task queue and update dependency tracking
+        self._register_task(task)
             
         logger.info(f"Added task to queue: {task_id}")
         
         # Display task details
-        table = Table(title=f"Task Details: {task_id}")
-        table.add_column("Field", style="cyan")
-        table.add_column("Value", style="green")
-        
-        table.add_row("Type", task_type)
-        table.add_row("Description", description)
-        table.add_row("Agent", agent_id)
-        table.add_row("Dependencies", ", ".join(dependencies) if dependencies else "None")
-        
-        self.console.print(table)
+        if self.verbose:
+            self._get_task_table().add_row(
+                task_id,
+                agent_id,
+                "queued",
+                f"{task_type}: {description} "
+                f"(depends on: {', '.join(dependencies) if dependencies else 'None'})"
+            )
         
     async def request_agent_task(
         self,
@@ -286,7 +382,7 @@ class AgentOrchestrator:
             raise AgentError(f"Unknown target agent: {target_agent_id}")
             
         # Create task ID
-        task_id = f"inter-{requesting_agent_id}-{target_agent_id}-{len(self.tasks)}"
+        task_id = f"inter-{requesting_agent_id}-{target_agent_id}-{next(self._inter_task_counter)}"
         
         # Add task with dependency on requesting agent's current task
         await self.add_task(
@@ -308,99 +404,221 @@ class AgentOrchestrator:
             "target_agent": target_agent_id
         }
         
+    def _register_task(self, task: TaskDependency) -> None:
+        """Add a task to the queue and index its dependencies for scheduling.
+        
+        Dependencies that already finished are satisfied immediately. Unknown
+        dependencies are counted like pending ones, so their dependents stay
+        blocked until a task with that ID finishes.
+        """
+        previous = self.tasks.get(task.task_id)
+        if previous is not None:
+            self._count_task(previous, -1)
+        self.tasks[task.task_id] = task
+        self._count_task(task, 1)
+        task.agent_ref = self.agents.get(task.agent_id)
+        if not task.depends_on:
+            # Most tasks are independent; they go straight to the ready queue
+            remaining = 0
+        else:
+            deps = self.task_dependencies[task.task_id] = set(task.depends_on)
+            for dep in deps:
+                self.reverse_dependencies[dep].add(task.task_id)
+                
+            remaining = sum(1 for dep in deps if dep not in self.completed_tasks)
+        self.remaining_deps[task.task_id] = remaining
+        if remaining == 0:
+            self.ready_queue.put_nowait(task.task_id)
+            self._progress.set()
+            
+    def _count_task(self, task: TaskDependency, delta: int) -> None:
+        """Add a task to (or with -1, remove it from) the status tallies."""
+        self._task_status_counts[task.status] += delta
+        self._agent_task_counts[task.agent_id][task.status] += delta
+        
+    def _set_task_status(self, task: TaskDependency, status: str) -> None:
+        """Change a task's status, keeping the tallies in step.
+        
+        Set ``result``, ``start_time`` and ``end_time`` before calling this;
+        it also invalidates the cached ``get_task_status`` view.
+        """
+        task._status_dict = None
+        if self.tasks.get(task.task_id) is task:
+            self._count_task(task, -1)
+            task.status = status
+            self._count_task(task, 1)
+        else:
+            task.status = status
+            
+    def _remove_task(self, task_id: str) -> Optional[TaskDependency]:
+        """Remove a task from the active tasks, if present."""
+        task = self.tasks.pop(task_id, None)
+        if task is not None:
+            self._count_task(task, -1)
+        return task
+        
     def _get_ready_tasks(self) -> List[TaskDependency]:
         """Get tasks that are ready to execute (dependencies satisfied)."""
         ready_tasks = []
-        for task in self.tasks.values():
-            if task.status == "pending" and all(
-                dep in self.completed_tasks
-                for dep in task.depends_on
-            ):
+        while not self.ready_queue.empty():
+            task = self.tasks.get(self.ready_queue.get_nowait())
+            if task is not None and task.status == "pending":
                 ready_tasks.append(task)
         return ready_tasks
         
+    def _mark_done(self, task_id: str) -> None:
+        """Release the direct dependents of a finished task."""
+        if self.remaining_deps.pop(task_id, None) is None:
+            # Already released
+            return
+        for dependent in self.reverse_dependencies.get(task_id, ()):
+            if dependent in self.remaining_deps:
+                self.remaining_deps[dependent] -= 1
+                if self.remaining_deps[dependent] == 0:
+                    self.ready_queue.put_nowait(dependent)
+                    self._progress.set()
+        
     async def process_tasks(self):
         """Process all tasks in the queue with dependency management."""
         logger.info("Starting task processing...")
         
-        while self.tasks:
-            # Get tasks ready to execute
-            ready_tasks = self._get_ready_tasks()
+        if self.verbose and self._live is None:
+            self._live = Live(self._get_task_table(), console=self.console, refresh_per_second=4)
+            self._live.start()
             
-            if not ready_tasks:
-                # No tasks ready, wait for dependencies
-                await asyncio.sleep(1)
-                continue
+        try:
+            # A task leaves self.tasks before its milestone bookkeeping is
+            # done, so keep going until the workers are idle too
+            while self.tasks or self._running:
+                # Get tasks ready to execute
+                ready_tasks = self._get_ready_tasks()
                 
-            # Process ready tasks
-            for task in ready_tasks:
-                if task.agent_id not in self.agents:
-                    logger.error(f"Unknown agent: {task.agent_id}")
+                if not ready_tasks:
+                    if self._running == 0:
+                        # Nothing is running that could unblock the rest
+                        logger.warning(
+                            f"Stopping with {len(self.tasks)} tasks blocked: "
+                            f"{', '.join(self.tasks)}"
+                        )
+                        break
+                    # No tasks ready, wait for a running task to finish
+                    await self._progress.wait()
+                    self._progress.clear()
                     continue
                     
-                # Create task object
-                task_obj = Task(
-                    task_id=task.task_id,
-                    task_type=task.agent_id,
-                    description=task.description,
-                    metadata=task.metadata
-                )
-                
-                try:
-                    # Execute task with retry logic
-                    result = await self._execute_task_with_retry(task.agent_id, task_obj)
-                    
-                    # Ensure result is a dictionary
-                    if not isinstance(result, dict):
-                        result = {"status": "success", "result": result}
-                    if "status" not in result:
-                        result["status"] = "success"
-                    
-                    # Update task status
-                    task.status = "completed" if result["status"] == "success" else "failed"
-                    task.result = result
-                    
-                    # Handle PM agent task results that contain new tasks
-                    if task.agent_id == "pm_agent":
-                        await self._handle_pm_task_results(task, result)
+                # Hand ready tasks to their agents' workers
+                for task in ready_tasks:
+                    self._dispatch(task)
                     
-                    # Move to completed tasks
-                    self.tasks.pop(task.task_id)
-                    self.completed_tasks[task.task_id] = task
-                    
-                    # Display result
-                    self._display_result(task_obj, result)
-                    
-                    # Update milestone if applicable
-                    if task.metadata and task.metadata.get("milestone_id"):
-                        await self._update_milestone_progress(task.metadata["milestone_id"])
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process task {task.task_id}: {str(e)}")
-                    task.status = "failed"
-                    task.result = {
-                        "status": "error",
-                        "error": str(e),
-                        "error_type": "processing_error"
-                    }
-                    self.tasks.pop(task.task_id)
-                    self.completed_tasks[task.task_id] = task
-                    
-                    # Record failed task completion
-                    completion = TaskCompletion(
-                        task_id=task.task_id,
-                        agent_id=task.agent_id,
-                        estimated_duration=task.metadata.get("estimated_duration", 0),
-                        actual_duration=(datetime.now() - task.start_time).total_seconds() if task.start_time else 0,
-                        start_time=task.start_time,
-                        end_time=datetime.now(),
-                        complexity=task.metadata.get("complexity", 5),
-                        dependencies=task.depends_on,
-                        success=False,
-                        notes=f"Failed: {str(e)}"
-                    )
-                    await self.feedback_system.record_task_completion(completion)
+            # Let the workers finish what they hold before they are cancelled
+            await asyncio.gather(*(queue.join() for queue in self.agent_queues.values()))
+        finally:
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers.clear()
+            self.agent_queues.clear()
+            self._running = 0
+            if self._live is not None:
+                self._live.stop()
+                self._live = None
+            
+    def _dispatch(self, task: TaskDependency) -> None:
+        """Queue a ready task for its agent, starting the agent's worker on first use."""
+        queue = self.agent_queues.get(task.agent_id)
+        if queue is None:
+            if task.agent_ref is None:
+                # The agent may have been registered after the task was added
+                task.agent_ref = self.agents.get(task.agent_id)
+            if task.agent_ref is None:
+                logger.error(f"Unknown agent: {task.agent_id}")
+                return
+            queue = self.agent_queues[task.agent_id] = asyncio.Queue()
+            self._workers.append(asyncio.create_task(self._agent_worker(task.agent_id, queue)))
+        queue.put_nowait(task)
+        self._running += 1
+        
+    async def _agent_worker(self, agent_id: str, queue: asyncio.Queue) -> None:
+        """Run the tasks queued for one agent, one at a time and in ready order."""
+        while True:
+            task = await queue.get()
+            try:
+                await self._run_one(task)
+            except Exception as e:
+                logger.error(f"Unhandled error while processing task {task.task_id} on {agent_id}: {e}")
+            finally:
+                queue.task_done()
+                self._running -= 1
+                self._progress.set()
                 
+    async def _run_one(self, task: TaskDependency) -> None:
+        """Execute a single ready task and record its outcome."""
+        # Create task object
+        task_obj = Task(
+            task_id=task.task_id,
+            task_type=task.agent_id,
+            description=task.description,
+            metadata=task.metadata
+        )
+        
+        try:
+            # Execute task with retry logic
+            result = await self._execute_task_with_retry(task.agent_id, task_obj, task)
+            
+            # Ensure result is a dictionary
+            if not isinstance(result, dict):
+                result = {"status": "success", "result": result}
+            if "status" not in result:
+                result["status"] = "success"
+            
+            # Update task status
+            task.result = result
+            self._set_task_status(task, "completed" if result["status"] == "success" else "failed")
+            
+            # Handle PM agent task results that contain new tasks
+            if task.agent_id == "pm_agent":
+                await self._handle_pm_task_results(task, result)
+            
+            # Move to completed tasks
+            self._remove_task(task.task_id)
+            self.completed_tasks[task.task_id] = task
+            self._mark_done(task.task_id)
+            
+            # Display result
+            self._display_result(task_obj, result)
+            
+            # Update milestone if applicable
+            if task.milestone_id:
+                await self._update_milestone_progress(task.milestone_id)
+            
+        except Exception as e:
+            logger.error(f"Failed to process task {task.task_id}: {str(e)}")
+            task.result = {
+                "status": "error",
+                "error": str(e),
+                "error_type": "processing_error"
+            }
+            self._set_task_status(task, "failed")
+            self._remove_task(task.task_id)
+            self.completed_tasks[task.task_id] = task
+            self._mark_done(task.task_id)
+            
+            # Record failed task completion
+            end_time = datetime.now()
+            completion = TaskCompletion(
+                task_id=task.task_id,
+                agent_id=task.agent_id,
+                estimated_duration=task.estimated_duration,
+                actual_duration=(end_time - task.start_time).total_seconds() if task.start_time else 0,
+                start_time=task.start_time,
+                end_time=end_time,
+                complexity=task.complexity,
+                dependencies=task.depends_on,
+                success=False,
+                notes=f"Failed: {str(e)}"
+            )
+            self.feedback_system.submit_task_completion(completion)
+            
     async def _handle_pm_task_results(self, task: TaskDependency, result: Dict[str, Any]):
         """Handle PM agent task results that contain new tasks."""
         details = result.get("details", {})
@@ -425,90 +643,120 @@ class AgentOrchestrator:
             )
             
             # Add to task queue and update dependency tracking
-            self.tasks[new_task.task_id] = new_task
-            self.task_dependencies[new_task.task_id] = set(new_task.depends_on)
-            for dep in new_task.depends_on:
-                if dep not in self.reverse_dependencies:
-                    self.reverse_dependencies[dep] = set()
-                self.reverse_dependencies[dep].add(new_task.task_id)
+            self._register_task(new_task)
             
             logger.info(f"Added new task to queue: {new_task.task_id}")
             
+    def _get_retry_strategy(self, agent_id: str) -> RetryStrategy:
+        """Get the retry strategy configured for an agent."""
+        strategy = self._retry_strategies.get(agent_id)
+        if strategy is None:
+            agent_config = self.config.get("agents", {}).get(agent_id) or {}
+            retry_config = agent_config.get("retry")
+            strategy = RetryStrategy.from_config(retry_config) if retry_config else self.default_retry_strategy
+            self._retry_strategies[agent_id] = strategy
+        return strategy
+        
+    def _get_retry_count(self, error: Exception, agent_id: str) -> int:
+        """Get how many retries an error allows; 0 means fail immediately.
+        
+        The most specific entry in ``transient_errors`` along the exception's
+        MRO wins. Results are cached per concrete exception type.
+        """
+        error_type = type(error)
+        retry_count = self._retry_count_cache.get(error_type)
+        if retry_count is None:
+            retry_count = next(
+                (self._transient_errors[cls] for cls in error_type.__mro__ if cls in self._transient_errors),
+                0
+            )
+            self._retry_count_cache[error_type] = retry_count
+        return retry_count
+        
     async def _execute_task_with_retry(
         self,
         agent_id: str,
         task: Task,
-        attempt: int = 1
+        dependency: Optional[TaskDependency] = None
     ) -> Dict[str, Any]:
-        """Execute a task with smart retry logic."""
+        """Execute a task with smart retry logic.
+        
+        When the scheduler's ``dependency`` record is given, its resolved agent
+        and metadata are used instead of looking them up again.
+        """
         strategy = self._get_retry_strategy(agent_id)
-        start_time = time.time()
+        if dependency is not None and dependency.agent_ref is not None:
+            agent = dependency.agent_ref
+            estimated_duration = dependency.estimated_duration
+            complexity = dependency.complexity
+        else:
+            agent = self.agents[agent_id]
+            estimated_duration = task.metadata.get("estimated_duration", 0)
+            complexity = task.metadata.get("complexity", 5)
+        attempt = 0
         
-        try:
-            logger.info(
-                f"Executing task {task.task_id} with {agent_id} "
-                f"(attempt {attempt})"
-            )
-            result = await self.agents[agent_id].run_task(task)
-            
-            # Record successful execution
-            duration_ms = (time.time() - start_time) * 1000
-            record_metric(
-                agent_name=agent_id,
-                task_type=task.task_type,
-                task_description=task.description,
-                status="PASS",
-                duration_ms=duration_ms,
-                retries_attempted=attempt - 1,
-                retry_success=True if attempt > 1 else None,
-                retry_strategy_used=strategy.strategy if attempt > 1 else None
-            )
-            
-            # Record task completion
-            completion = TaskCompletion(
-                task_id=task.task_id,
-                agent_id=agent_id,
-                estimated_duration=task.metadata.get("estimated_duration", 0),
-                actual_duration=duration_ms / 1000,
-                start_time=datetime.fromtimestamp(start_time),
-                end_time=datetime.now(),
-                complexity=task.metadata.get("complexity", 5),
-                dependencies=task.metadata.get("dependencies", []),
-                success=True,
-                notes="Task completed successfully"
-            )
-            await self.feedback_system.record_task_completion(completion)
-            
-            return result
+        while True:
+            attempt += 1
+            start_ns = time.monotonic_ns()
             
-        except Exception as e:
-            retry_count = self._get_retry_count(e, agent_id)
-            duration_ms = (time.time() - start_time) * 1000
-            
-            if retry_count == 0:
-                # Fatal error or no retries allowed
-                logger.error(
-                    f"Task {task.task_id} failed with fatal error: {str(e)}"
-                )
-                record_metric(
-                    agent_name=agent_id,
-                    task_type=task.task_type,
-                    task_description=task.description,
-                    status="FAIL",
-                    duration_ms=duration_ms,
-                    retries_attempted=attempt - 1,
-                    retry_success=False if attempt > 1 else None,
-                    retry_strategy_used=strategy.strategy if attempt > 1 else None
+            try:
+                logger.info(
+                    f"Executing task {task.task_id} with {agent_id} "
+                    f"(attempt {attempt})"
                 )
-                return {
-                    "status": "error",
-                    "error": str(e),
-                    "error_type": "fatal",
-                    "attempts": attempt,
-                    "retry_strategy": strategy.strategy
-                }
+                result = await agent.run_task(task)
+                break
+                
+            except Exception as e:
+                retry_count = self._get_retry_count(e, agent_id)
+                duration_ms = (time.monotonic_ns() - start_ns) / 1e6
                 
-            if attempt <= retry_count:
+                if retry_count == 0:
+                    # Fatal error or no retries allowed
+                    logger.error(
+                        f"Task {task.task_id} failed with fatal error: {str(e)}"
+                    )
+                    record_metric(
+                        agent_name=agent_id,
+                        task_type=task.task_type,
+                        task_description=task.description,
+                        status="FAIL",
+                        duration_ms=duration_ms,
+                        retries_attempted=attempt - 1,
+                        retry_success=False if attempt > 1 else None,
+                        retry_strategy_used=strategy.strategy if attempt > 1 else None
+                    )
+                    return {
+                        "status": "error",
+                        "error": str(e),
+                        "error_type": "fatal",
+                        "attempts": attempt,
+                        "retry_strategy": strategy.strategy
+                    }
+                    
+                if attempt > retry_count:
+                    logger.error(
+                        f"Task {task.task_id} failed after {retry_count} attempts. "
+                        f"Final error: {str(e)}"
+                    )
+                    record_metric(
+                        agent_name=agent_id,
+                        task_type=task.task_type,
+                        task_description=task.description,
+                        status="FAIL",
+                        duration_ms=duration_ms,
+                        retries_attempted=attempt - 1,
+                        retry_success=False,
+                        retry_strategy_used=strategy.strategy
+                    )
+                    return {
+                        "status": "error",
+                        "error": str(e),
+                        "error_type": "max_retries_exceeded",
+                        "attempts": attempt,
+                        "retry_strategy": strategy.strategy
+                    }
+                    
                 delay = strategy.calculate_delay(attempt)
                 logger.warning(
                     f"Task {task.task_id} failed on attempt {attempt}: {str(e)}. "
@@ -517,52 +765,70 @@ class AgentOrchestrator:
                     f"Strategy: {strategy.strategy})"
                 )
                 await asyncio.sleep(delay)
-                return await self._execute_task_with_retry(
-                    agent_id=agent_id,
-                    task=task,
-                    attempt=attempt + 1
-                )
-            else:
-                logger.error(
-                    f"Task {task.task_id} failed after {retry_count} attempts. "
-                    f"Final error: {str(e)}"
-                )
-                record_metric(
-                    agent_name=agent_id,
-                    task_type=task.task_type,
-                    task_description=task.description,
-                    status="FAIL",
-                    duration_ms=duration_ms,
-                    retries_attempted=attempt - 1,
-                    retry_success=False,
-                    retry_strategy_used=strategy.strategy
-                )
-                return {
-                    "status": "error",
-                    "error": str(e),
-                    "error_type": "max_retries_exceeded",
-                    "attempts": attempt,
-                    "retry_strategy": strategy.strategy
-                }
+                
+        # Record successful execution
+        duration_ns = time.monotonic_ns() - start_ns
+        duration_ms = duration_ns / 1e6
+        record_metric(
+            agent_name=agent_id,
+            task_type=task.task_type,
+            task_description=task.description,
+            status="PASS",
+            duration_ms=duration_ms,
+            retries_attempted=attempt - 1,
+            retry_success=True if attempt > 1 else None,
+            retry_strategy_used=strategy.strategy if attempt > 1 else None
+        )
         
-    def _display_result(self, task: Task, result: Dict[str, Any]):
-        """Display task execution result."""
-        table = Table(title=f"Task Result: {task.task_id}")
-        table.add_column("Field", style="cyan")
-        table.add_column("Value", style="green")
+        # Record task completion
+        end_time = datetime.now()
+        completion = TaskCompletion(
+            task_id=task.task_id,
+            agent_id=agent_id,
+            estimated_duration=estimated_duration,
+            actual_duration=duration_ms / 1000,
+            start_time=end_time - timedelta(microseconds=duration_ns // 1000),
+            end_time=end_time,
+            complexity=complexity,
+            dependencies=task.metadata.get("dependencies", []),
+            success=True,
+            notes="Task completed successfully"
+        )
+        self.feedback_system.submit_task_completion(completion)
+        
+        return result
         
-        table.add_row("Description", task.description)
-        table.add_row("Status", result.get("status", "unknown"))
+    def _get_task_table(self) -> Table:
+        """Get the task activity table shared by all verbose task output."""
+        if self._task_table is None:
+            self._task_table = Table(title="Task Activity")
+            self._task_table.add_column("Task ID", style="cyan")
+            self._task_table.add_column("Agent", style="green")
+            self._task_table.add_column("Status", style="yellow")
+            self._task_table.add_column("Details")
+        return self._task_table
         
+    def _display_result(self, task: Task, result: Dict[str, Any]):
+        """Display task execution result."""
+        if not self.verbose:
+            return
+            
         if "error" in result:
-            table.add_row("Error", result["error"])
-            table.add_row("Error Type", result.get("error_type", "unknown"))
-            table.add_row("Attempts", str(result.get("attempts", 1)))
+            details = (
+                f"{result['error']} ({result.get('error_type', 'unknown')}, "
+                f"attempts: {result.get('attempts', 1)})"
+            )
         else:
-            for key, value in result.get("details", {}).items():
-                table.add_row(key, str(value))
-                
-        self.console.print(table)
+            details = ", ".join(
+                f"{key}={value}" for key, value in result.get("details", {}).items()
+            )
+            
+        self._get_task_table().add_row(
+            task.task_id,
+            task.task_type,
+            result.get("status", "unknown"),
+            details or task.description
+        )
         
     async def run(self):
         """Run the orchestrator."""
@@ -574,6 +840,115 @@ class AgentOrchestrator:
         except Exception as e:
             logger.error(f"Orchestrator error: {e}")
             raise 
+        finally:
+            await self._stop_milestone_flusher()
+            await self._stop_notification_flusher()
+            await self.feedback_system.close()
+            
+    async def _milestone_flush_loop(self) -> None:
+        """Write milestones.json whenever milestones change, coalescing bursts."""
+        while True:
+            await self._milestone_dirty.wait()
+            await asyncio.sleep(MILESTONE_FLUSH_DELAY)
+            self._milestone_dirty.clear()
+            self._milestone_flush = asyncio.ensure_future(self._flush_milestones())
+            try:
+                await asyncio.shield(self._milestone_flush)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to save milestones: {e}")
+            self._milestone_flush = None
+                
+    async def _stop_milestone_flusher(self) -> None:
+        """Stop the background milestone writer and persist pending changes.
+        
+        A save the loop already started runs to completion first, so its
+        worker thread can't replace milestones.json after the final save.
+        """
+        if self._milestone_flusher is not None:
+            self._milestone_flusher.cancel()
+            await asyncio.gather(self._milestone_flusher, return_exceptions=True)
+            self._milestone_flusher = None
+        in_flight, self._milestone_flush = self._milestone_flush, None
+        if in_flight is not None:
+            try:
+                await in_flight
+            except Exception as e:
+                logger.error(f"Failed to save milestones: {e}")
+        if self._milestone_dirty.is_set():
+            self._milestone_dirty.clear()
+            await self._flush_milestones()
+            
+    def _invalidate_milestone(self, milestone_id: str) -> None:
+        """Forget cached projections of a milestone after it changes."""
+        self._dirty_milestones.add(milestone_id)
+        self._milestone_dicts.pop(milestone_id, None)
+        
+    def _mark_milestone_dirty(self, milestone_id: str) -> None:
+        """Schedule a save of a changed milestone."""
+        self._invalidate_milestone(milestone_id)
+        self._milestone_dirty.set()
+        
+    def _milestone_dict(self, milestone: 'MilestoneStatus') -> Dict[str, Any]:
+        """Get the milestone as a dictionary, reusing it until the milestone changes."""
+        data = self._milestone_dicts.get(milestone.milestone_id)
+        if data is None:
+            data = self._milestone_dicts[milestone.milestone_id] = milestone.dict()
+        return data
+        
+    async def _flush_milestones(self) -> None:
+        """Encode changed milestones on the event loop and write the file from a worker thread.
+        
+        Unchanged milestones reuse their previously encoded JSON, so the cost
+        of a save grows with the number of changed milestones, not the total.
+        """
+        # Hold the lock across encode and write so an older snapshot can't land last
+        async with self._milestone_write_lock:
+            await self._flush_milestones_locked()
+            
+    async def _flush_milestones_locked(self) -> None:
+        """Body of _flush_milestones; the caller holds the milestone write lock."""
+        fragments = self._milestone_fragments
+        dirty, self._dirty_milestones = self._dirty_milestones, set()
+        for milestone_id in dirty:
+            fragments.pop(milestone_id, None)
+            
+        parts = []
+        for milestone_id, milestone in self.milestones.items():
+            part = fragments.get(milestone_id)
+            if part is None:
+                part = fragments[milestone_id] = dump_json(self._milestone_dict(milestone), indent=True)
+            parts.append(part)
+        if len(fragments) > len(self.milestones):
+            # Drop encodings of milestones that no longer exist
+            for milestone_id in fragments.keys() - self.milestones.keys():
+                del fragments[milestone_id]
+                self._milestone_dicts.pop(milestone_id, None)
+                
+        data = b"[\n" + b",\n".join(parts) + b"\n]" if parts else b"[]"
+        milestone_file = self.feedback_system.data_dir / "milestones.json"
+        await asyncio.to_thread(self._write_milestones, milestone_file, data)
+        
+    @staticmethod
+    def _read_milestones(milestone_file: Path) -> List[Dict[str, Any]]:
+        """Read and parse the milestone file, or return no records if it doesn't exist."""
+        try:
+            data = milestone_file.read_bytes()
+        except FileNotFoundError:
+            return []
+        return load_json(data)
+        
+    @staticmethod
+    def _write_milestones(milestone_file: Path, data: bytes) -> None:
+        """Atomically replace the milestone file with the given contents."""
+        tmp_file = milestone_file.with_name(f"{milestone_file.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, milestone_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
     def register_agent(self, agent: 'BaseAgent'):
         """Register an agent with the orchestrator."""
@@ -587,7 +962,7 @@ class AgentOrchestrator:
             raise ValueError(f"Agent {agent_id} not registered")
             
         task = TaskDependency(task_id, agent_id, description, depends_on, metadata)
-        self.tasks[task_id] = task
+        self._register_task(task)
         
         # Check if this task is part of a milestone
         if metadata and metadata.get("milestone_id"):
@@ -618,9 +993,9 @@ class AgentOrchestrator:
                 raise ValueError(f"Dependency {dep_id} not completed")
                 
         # Execute task
-        agent = self.agents[task.agent_id]
+        agent = task.agent_ref or self.agents[task.agent_id]
         task.start_time = datetime.now()
-        task.status = "running"
+        self._set_task_status(task, "running")
         
         try:
             result = await agent.run_task(Task(
@@ -630,51 +1005,51 @@ class AgentOrchestrator:
                 metadata=task.metadata
             ))
             
-            task.status = "completed"
             task.end_time = datetime.now()
             task.result = result
+            self._set_task_status(task, "completed")
             
             # Record task completion
             completion = TaskCompletion(
                 task_id=task_id,
                 agent_id=task.agent_id,
-                estimated_duration=task.metadata.get("estimated_duration", 0),
+                estimated_duration=task.estimated_duration,
                 actual_duration=(task.end_time - task.start_time).total_seconds(),
                 start_time=task.start_time,
                 end_time=task.end_time,
-                complexity=task.metadata.get("complexity", 5),
+                complexity=task.complexity,
                 dependencies=task.depends_on,
                 success=True,
                 notes=f"Task completed successfully"
             )
             
-            await self.feedback_system.record_task_completion(completion)
+            self.feedback_system.submit_task_completion(completion)
             
             # Update milestone if applicable
-            if task.metadata and task.metadata.get("milestone_id"):
-                await self._update_milestone_progress(task.metadata["milestone_id"])
+            if task.milestone_id:
+                await self._update_milestone_progress(task.milestone_id)
                 
             return result
             
         except Exception as e:
-            task.status = "failed"
             task.end_time = datetime.now()
+            self._set_task_status(task, "failed")
             
             # Record failed task completion
             completion = TaskCompletion(
                 task_id=task_id,
                 agent_id=task.agent_id,
-                estimated_duration=task.metadata.get("estimated_duration", 0),
+                estimated_duration=task.estimated_duration,
                 actual_duration=(task.end_time - task.start_time).total_seconds(),
                 start_time=task.start_time,
                 end_time=task.end_time,
-                complexity=task.metadata.get("complexity", 5),
+                complexity=task.complexity,
                 dependencies=task.depends_on,
                 success=False,
                 notes=f"Failed: {str(e)}"
             )
             
-            await self.feedback_system.record_task_completion(completion)
+            self.feedback_system.submit_task_completion(completion)
             raise
             
     async def _update_milestone_progress(self, milestone_id: str) -> None:
@@ -712,11 +1087,9 @@ class AgentOrchestrator:
         milestone.progress = progress
         
         try:
-            # Save updated milestone data
-            milestone_file = self.feedback_system.data_dir / "milestones.json"
-            with open(milestone_file, 'w') as f:
-                json.dump([m.dict() for m in self.milestones.values()], f, indent=2)
-                
+            # Schedule a save of the updated milestone data
+            self._mark_milestone_dirty(milestone_id)
+            
             # Send milestone update notification
             await self._send_milestone_notification(milestone)
             
@@ -736,15 +1109,14 @@ class AgentOrchestrator:
             delay_reason: Reason for the delay
         """
         milestone.status = "delayed"
+        self._invalidate_milestone(milestone.milestone_id)
         
         try:
             # Send delay notification
             await self._send_delay_notification(milestone, delay_reason)
             
-            # Update milestone data
-            milestone_file = self.feedback_system.data_dir / "milestones.json"
-            with open(milestone_file, 'w') as f:
-                json.dump([m.dict() for m in self.milestones.values()], f, indent=2)
+            # Save the delayed milestone now rather than on the next batched flush
+            await self._flush_milestones()
                 
             logger.warning(
                 f"Milestone {milestone.milestone_id} delayed: {delay_reason}"
@@ -754,7 +1126,7 @@ class AgentOrchestrator:
             raise FatalError(f"Milestone delay handling failed: {e}")
             
     async def _send_milestone_notification(self, milestone: 'MilestoneStatus') -> None:
-        """Send milestone update notification via Slack bot.
+        """Queue a milestone update notification for the Slack bot.
         
         Args:
             milestone: The milestone to notify about
@@ -763,24 +1135,13 @@ class AgentOrchestrator:
             logger.warning("Slack bot not available for milestone notification")
             return
             
-        try:
-            slack_bot = self.agents["slack_bot"]
-            await slack_bot.run_task(Task(
-                task_id=f"milestone-notification-{milestone.milestone_id}",
-                task_type="slack_bot",
-                description="Send milestone update notification",
-                metadata={
-                    "type": "milestone_notification",
-                    "milestone": milestone.dict()
-                }
-            ))
-            logger.info(f"Sent milestone notification for {milestone.milestone_id}")
-        except Exception as e:
-            logger.error(f"Failed to send milestone notification: {e}")
-            # Don't raise here as this is a non-critical operation
+        self._queue_notification({
+            "type": "milestone_notification",
+            "milestone": self._milestone_dict(milestone)
+        })
         
     async def _send_delay_notification(self, milestone: 'MilestoneStatus', delay_reason: str) -> None:
-        """Send milestone delay notification via Slack bot.
+        """Queue a milestone delay notification for the Slack bot.
         
         Args:
             milestone: The delayed milestone
@@ -790,28 +1151,82 @@ class AgentOrchestrator:
             logger.warning("Slack bot not available for delay notification")
             return
             
+        self._queue_notification({
+            "type": "delay_notification",
+            "milestone": self._milestone_dict(milestone),
+            "delay_reason": delay_reason
+        })
+        
+    def _queue_notification(self, notification: Dict[str, Any]) -> None:
+        """Queue a notification, starting the background sender on first use."""
+        self._notification_queue.put_nowait(notification)
+        if self._notification_flusher is None:
+            self._notification_flusher = asyncio.create_task(self._notification_flush_loop())
+            
+    async def _notification_flush_loop(self) -> None:
+        """Send queued notifications in batches of up to NOTIFICATION_BATCH_SIZE."""
+        while True:
+            batch = [await self._notification_queue.get()]
+            await asyncio.sleep(NOTIFICATION_FLUSH_DELAY)
+            while len(batch) < NOTIFICATION_BATCH_SIZE and not self._notification_queue.empty():
+                batch.append(self._notification_queue.get_nowait())
+            try:
+                await self._send_notification_batch(batch)
+            finally:
+                for _ in batch:
+                    self._notification_queue.task_done()
+                    
+    async def _stop_notification_flusher(self) -> None:
+        """Send any queued notifications and stop the background sender."""
+        if self._notification_flusher is None:
+            return
+        await self._notification_queue.join()
+        self._notification_flusher.cancel()
+        await asyncio.gather(self._notification_flusher, return_exceptions=True)
+        self._notification_flusher = None
+        
+    async def _send_notification_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Send a batch of notifications through the Slack bot in one task."""
+        # Only the latest update per milestone is worth sending
+        latest: Dict[str, Dict[str, Any]] = {}
+        notifications = []
+        for notification in batch:
+            if notification["type"] == "milestone_notification":
+                latest[notification["milestone"]["milestone_id"]] = notification
+            else:
+                notifications.append(notification)
+        notifications.extend(latest.values())
+        
+        if len(notifications) == 1:
+            notification = notifications[0]
+            kind = "milestone" if notification["type"] == "milestone_notification" else "delay"
+            task_id = f"{kind}-notification-{notification['milestone']['milestone_id']}"
+            description = f"Send milestone {'update' if kind == 'milestone' else 'delay'} notification"
+            metadata = notification
+        else:
+            task_id = f"notification-batch-{uuid.uuid4()}"
+            description = "Send batched milestone notifications"
+            metadata = {"type": "notification_batch", "notifications": notifications}
+            
         try:
             slack_bot = self.agents["slack_bot"]
-            await slack_bot.run_task(Task(
-                task_id=f"delay-notification-{milestone.milestone_id}",
-                task_type="slack_bot",
-                description="Send milestone delay notification",
-                metadata={
-                    "type": "delay_notification",
-                    "milestone": milestone.dict(),
-                    "delay_reason": delay_reason
-                }
-            ))
-            logger.info(f"Sent delay notification for {milestone.milestone_id}")
+            await slack_bot.run_task(SlackNotifyPayload(task_id, description, metadata))
+            logger.info(f"Sent {len(notifications)} milestone notifications")
         except Exception as e:
-            logger.error(f"Failed to send delay notification: {e}")
+            logger.error(f"Failed to send milestone notifications: {e}")
             # Don't raise here as this is a non-critical operation
         
-    def get_task_status(self, task_id: str) -> Dict[str, Any]:
+    def get_task_status(self, task_id: str, copy: bool = True) -> Dict[str, Any]:
         """Get the current status of a task.
         
+        The dictionary is built once per status change and cached on the task.
+        
         Args:
             task_id: ID of the task to get status for
+            copy: Whether to return a deep copy of the cached dictionary,
+                including the task's result, dependencies and metadata.
+                Pollers may pass False to skip the copy, but must not mutate
+                the result or anything in it.
             
         Returns:
             Dictionary containing task status information
@@ -819,21 +1234,24 @@ class AgentOrchestrator:
         Raises:
             ValueError: If task is not found
         """
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             raise ValueError(f"Task {task_id} not found")
             
-        task = self.tasks[task_id]
-        return {
-            "task_id": task_id,
-            "agent_id": task.agent_id,
-            "description": task.description,
-            "status": task.status,
-            "start_time": task.start_time.isoformat() if task.start_time else None,
-            "end_time": task.end_time.isoformat() if task.end_time else None,
-            "result": task.result,
-            "dependencies": task.depends_on,
-            "metadata": task.metadata
-        }
+        status = task._status_dict
+        if status is None:
+            status = task._status_dict = {
+                "task_id": task_id,
+                "agent_id": task.agent_id,
+                "description": task.description,
+                "status": task.status,
+                "start_time": task.start_time.isoformat() if task.start_time else None,
+                "end_time": task.end_time.isoformat() if task.end_time else None,
+                "result": task.result,
+                "dependencies": task.depends_on,
+                "metadata": task.metadata
+            }
+        return deepcopy(status) if copy else status
         
     def get_milestone_status(self, milestone_id: str) -> Dict[str, Any]:
         """Get the current status of a milestone.
@@ -864,21 +1282,23 @@ class AgentOrchestrator:
             - Progress tracking
         """
         try:
+            task_counts = self._task_status_counts
+            milestone_counts = Counter(milestone.status for milestone in self.milestones.values())
             metrics = {
                 "timestamp": datetime.now().isoformat(),
                 "tasks": {
                     "total": len(self.tasks),
-                    "completed": sum(1 for task in self.tasks.values() if task.status == "completed"),
-                    "failed": sum(1 for task in self.tasks.values() if task.status == "failed"),
-                    "in_progress": sum(1 for task in self.tasks.values() if task.status == "running"),
-                    "pending": sum(1 for task in self.tasks.values() if task.status == "pending")
+                    "completed": task_counts["completed"],
+                    "failed": task_counts["failed"],
+                    "in_progress": task_counts["running"],
+                    "pending": task_counts["pending"]
                 },
                 "milestones": {
                     "total": len(self.milestones),
-                    "completed": sum(1 for milestone in self.milestones.values() if milestone.status == "completed"),
-                    "delayed": sum(1 for milestone in self.milestones.values() if milestone.status == "delayed"),
-                    "in_progress": sum(1 for milestone in self.milestones.values() if milestone.status == "in_progress"),
-                    "pending": sum(1 for milestone in self.milestones.values() if milestone.status == "pending"),
+                    "completed": milestone_counts["completed"],
+                    "delayed": milestone_counts["delayed"],
+                    "in_progress": milestone_counts["in_progress"],
+                    "pending": milestone_counts["pending"],
                     "progress": {
                         milestone_id: milestone.progress
                         for milestone_id, milestone in self.milestones.items()
@@ -889,16 +1309,17 @@ class AgentOrchestrator:
             
             # Add agent-specific metrics
             for agent_id, agent in self.agents.items():
-                agent_tasks = [task for task in self.tasks.values() if task.agent_id == agent_id]
+                agent_counts = self._agent_task_counts.get(agent_id) or Counter()
+                total_tasks = sum(agent_counts.values())
                 metrics["agents"][agent_id] = {
-                    "total_tasks": len(agent_tasks),
-                    "completed_tasks": sum(1 for task in agent_tasks if task.status == "completed"),
-                    "failed_tasks": sum(1 for task in agent_tasks if task.status == "failed"),
-                    "in_progress_tasks": sum(1 for task in agent_tasks if task.status == "running"),
-                    "pending_tasks": sum(1 for task in agent_tasks if task.status == "pending"),
+                    "total_tasks": total_tasks,
+                    "completed_tasks": agent_counts["completed"],
+                    "failed_tasks": agent_counts["failed"],
+                    "in_progress_tasks": agent_counts["running"],
+                    "pending_tasks": agent_counts["pending"],
                     "success_rate": (
-                        sum(1 for task in agent_tasks if task.status == "completed") / len(agent_tasks) * 100
-                        if agent_tasks else 0
+                        agent_counts["completed"] / total_tasks * 100
+                        if total_tasks else 0
                     )
                 }
                 
@@ -1,11 +1,49 @@
 """Secure communication module for P.E.P.P.E.R."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from loguru import logger
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import json
 import base64
+import binascii
+import hashlib
+import hmac
 import os
+from ..json_utils import dump_json, load_json
+
+# AES-GCM nonce length in bytes; a fresh random nonce prefixes every ciphertext
+NONCE_SIZE = 12
+
+# In-process messages skip encryption: "L:" + base64(truncated HMAC tag + JSON).
+# ':' never appears in base64, so the prefix can't be confused with a ciphertext.
+LOCAL_PREFIX = "L:"
+LOCAL_TAG_SIZE = 16
+
+def _derive_key(encryption_key: Union[str, bytes]) -> bytes:
+    """Turn a configured key into 32 bytes of AES-256 key material.
+    
+    URL-safe base64 encodings of 32 bytes (generated keys, Fernet keys) are
+    used as-is; any other value is treated as a passphrase and hashed.
+    """
+    key_bytes = encryption_key if isinstance(encryption_key, bytes) else encryption_key.encode()
+    try:
+        decoded = base64.urlsafe_b64decode(key_bytes)
+    except (binascii.Error, ValueError):
+        decoded = b""
+    if len(decoded) == 32:
+        return decoded
+    return hashlib.sha256(key_bytes).digest()
+
+def _canonical_bytes(message: Dict[str, Any]) -> bytes:
+    """Encode a message as compact, key-sorted JSON for signing.
+    
+    Always the stdlib encoder: orjson formats floats and NaN differently and
+    rejects some keys and integers, so signatures made with one encoder
+    wouldn't verify on a host using the other.
+    """
+    return json.dumps(
+        message, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    ).encode("utf-8")
 
 class SecureCommunication:
     """Handles secure communication between agents."""
@@ -18,27 +56,58 @@ class SecureCommunication:
         """
         self.encryption_key = encryption_key or os.getenv('CORE_ENCRYPTION_KEY')
         if not self.encryption_key:
-            self.encryption_key = Fernet.generate_key()
+            self.encryption_key = base64.urlsafe_b64encode(AESGCM.generate_key(bit_length=256)).decode()
             logger.warning("No encryption key provided, generated new key")
-        self.cipher_suite = Fernet(self.encryption_key.encode())
+        key = _derive_key(self.encryption_key)
+        self._aesgcm = AESGCM(key)
+        # Separate key for message signatures, derived from the encryption key
+        self._signing_key = hmac.new(key, b"pepper-message-signing", hashlib.sha256).digest()
         
-    def encrypt_message(self, message: Dict[str, Any]) -> str:
+    def encrypt_message(self, message: Dict[str, Any], local: bool = False) -> str:
         """Encrypt a message.
         
         Args:
             message: Message to encrypt
+            local: Whether the message stays inside this process. Local
+                messages are authenticated but not encrypted.
             
         Returns:
             Encrypted message as base64 string
         """
         try:
-            message_str = json.dumps(message)
-            encrypted_data = self.cipher_suite.encrypt(message_str.encode())
-            return base64.b64encode(encrypted_data).decode()
+            if local:
+                payload = dump_json(message)
+                tag = hmac.new(self._signing_key, payload, hashlib.sha256).digest()[:LOCAL_TAG_SIZE]
+                return LOCAL_PREFIX + base64.b64encode(tag + payload).decode()
+            return base64.b64encode(self.encrypt_message_bytes(message)).decode()
         except Exception as e:
             logger.error(f"Failed to encrypt message: {e}")
             raise
             
+    def encrypt_message_bytes(self, message: Dict[str, Any]) -> bytes:
+        """Encrypt a message for a channel that carries raw bytes.
+        
+        Args:
+            message: Message to encrypt
+            
+        Returns:
+            Nonce followed by the ciphertext
+        """
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self._aesgcm.encrypt(nonce, dump_json(message), None)
+        
+    def decrypt_message_bytes(self, encrypted_data: bytes) -> Dict[str, Any]:
+        """Decrypt a message produced by ``encrypt_message_bytes``.
+        
+        Args:
+            encrypted_data: Nonce followed by the ciphertext
+            
+        Returns:
+            Decrypted message as dictionary
+        """
+        nonce, ciphertext = encrypted_data[:NONCE_SIZE], encrypted_data[NONCE_SIZE:]
+        return load_json(self._aesgcm.decrypt(nonce, ciphertext, None))
+            
     def decrypt_message(self, encrypted_message: str) -> Dict[str, Any]:
         """Decrypt a message.
         
@@ -49,9 +118,15 @@ class SecureCommunication:
             Decrypted message as dictionary
         """
         try:
-            encrypted_data = base64.b64decode(encrypted_message.encode())
-            decrypted_data = self.cipher_suite.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode())
+            if encrypted_message.startswith(LOCAL_PREFIX):
+                data = base64.b64decode(encrypted_message[len(LOCAL_PREFIX):].encode())
+                tag, payload = data[:LOCAL_TAG_SIZE], data[LOCAL_TAG_SIZE:]
+                expected_tag = hmac.new(self._signing_key, payload, hashlib.sha256).digest()[:LOCAL_TAG_SIZE]
+                if not hmac.compare_digest(tag, expected_tag):
+                    raise ValueError("Invalid local message tag")
+                return load_json(payload)
+                
+            return self.decrypt_message_bytes(base64.b64decode(encrypted_message.encode()))
         except Exception as e:
             logger.error(f"Failed to decrypt message: {e}")
             raise
@@ -67,9 +142,8 @@ class SecureCommunication:
             True if signature is valid, False otherwise
         """
         try:
-            message_str = json.dumps(message, sort_keys=True)
-            expected_signature = self.cipher_suite.encrypt(message_str.encode())
-            return signature == base64.b64encode(expected_signature).decode()
+            expected_signature = hmac.new(self._signing_key, _canonical_bytes(message), hashlib.sha256).digest()
+            return hmac.compare_digest(base64.b64decode(signature), expected_signature)
         except Exception as e:
             logger.error(f"Failed to verify message: {e}")
             return False
@@ -84,8 +158,7 @@ class SecureCommunication:
             Message signature
         """
         try:
-            message_str = json.dumps(message, sort_keys=True)
-            signature = self.cipher_suite.encrypt(message_str.encode())
+            signature = hmac.new(self._signing_key, _canonical_bytes(message), hashlib.sha256).digest()
             return base64.b64encode(signature).decode()
         except Exception as e:
             logger.error(f"Failed to sign message: {e}")
@@ -1,38 +1,93 @@
 """Email utility supporting multiple providers (SMTP, Mailgun, SendGrid)."""
 
+import io
 import os
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from email import policy
+from email.generator import BytesGenerator
+from email.message import EmailMessage
 from typing import List, Optional, Union
 from loguru import logger
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+@dataclass(frozen=True)
+class EmailConfig:
+    """Email settings read from the environment."""
+    provider: str
+    from_email: Optional[str]
+    to_email: Optional[str]
+    smtp_host: Optional[str]
+    smtp_port: int
+    smtp_username: Optional[str]
+    smtp_password: Optional[str]
+    smtp_use_tls: bool
+    mailgun_api_key: Optional[str]
+    mailgun_domain: Optional[str]
+    sendgrid_api_key: Optional[str]
+
+@lru_cache(maxsize=1)
+def _email_config() -> EmailConfig:
+    """Load .env and read the email settings, once per process."""
+    load_dotenv()
+    return EmailConfig(
+        provider=os.getenv('EMAIL_PROVIDER', 'smtp').lower(),
+        from_email=os.getenv('EMAIL_FROM'),
+        to_email=os.getenv('EMAIL_TO'),
+        smtp_host=os.getenv('SMTP_HOST'),
+        smtp_port=int(os.getenv('SMTP_PORT', '587')),
+        smtp_username=os.getenv('SMTP_USERNAME'),
+        smtp_password=os.getenv('SMTP_PASSWORD'),
+        smtp_use_tls=os.getenv('SMTP_USE_TLS', 'true').lower() == 'true',
+        mailgun_api_key=os.getenv('MAILGUN_API_KEY'),
+        mailgun_domain=os.getenv('MAILGUN_DOMAIN'),
+        sendgrid_api_key=os.getenv('SENDGRID_API_KEY')
+    )
+
 class Emailer:
     """Email utility class supporting multiple providers."""
     
     def __init__(self):
-        load_dotenv()
-        self.provider = os.getenv('EMAIL_PROVIDER', 'smtp').lower()
-        self.from_email = os.getenv('EMAIL_FROM')
-        self.to_email = os.getenv('EMAIL_TO')
+        self.cfg = cfg = _email_config()
+        self.provider = cfg.provider
+        self.from_email = cfg.from_email
+        self.to_email = cfg.to_email
         
         if not self.from_email or not self.to_email:
             logger.warning("Email configuration incomplete")
             
+        # Keep-alive session shared by the HTTP API providers
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+            
         # Initialize provider-specific settings
         if self.provider == 'smtp':
-            self.smtp_host = os.getenv('SMTP_HOST')
-            self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
-            self.smtp_username = os.getenv('SMTP_USERNAME')
-            self.smtp_password = os.getenv('SMTP_PASSWORD')
-            self.smtp_use_tls = os.getenv('SMTP_USE_TLS', 'true').lower() == 'true'
+            self.smtp_host = cfg.smtp_host
+            self.smtp_port = cfg.smtp_port
+            self.smtp_username = cfg.smtp_username
+            self.smtp_password = cfg.smtp_password
+            self.smtp_use_tls = cfg.smtp_use_tls
+            # Logged-in connection reused across sends; one send at a time
+            self._smtp: Optional[smtplib.SMTP] = None
+            self._smtp_lock = threading.Lock()
         elif self.provider == 'mailgun':
-            self.mailgun_api_key = os.getenv('MAILGUN_API_KEY')
-            self.mailgun_domain = os.getenv('MAILGUN_DOMAIN')
+            self.mailgun_api_key = cfg.mailgun_api_key
+            self.mailgun_domain = cfg.mailgun_domain
         elif self.provider == 'sendgrid':
-            self.sendgrid_api_key = os.getenv('SENDGRID_API_KEY')
+            self.sendgrid_api_key = cfg.sendgrid_api_key
+            
+        # Send method for the configured provider, resolved once
+        self._dispatch = {
+            'smtp': self._send_smtp,
+            'mailgun': self._send_mailgun,
+            'sendgrid': self._send_sendgrid
+        }.get(self.provider)
+        if self._dispatch is None:
+            logger.error(f"Unsupported email provider: {self.provider}")
             
     def send_email(
         self,
@@ -57,21 +112,63 @@ class Emailer:
             logger.error("Cannot send email: EMAIL_FROM not configured")
             return False
             
+        if self._dispatch is None:
+            logger.error(f"Unsupported email provider: {self.provider}")
+            return False
+            
         try:
-            if self.provider == 'smtp':
-                return self._send_smtp(to, subject, body, html_body)
-            elif self.provider == 'mailgun':
-                return self._send_mailgun(to, subject, body, html_body)
-            elif self.provider == 'sendgrid':
-                return self._send_sendgrid(to, subject, body, html_body)
-            else:
-                logger.error(f"Unsupported email provider: {self.provider}")
-                return False
-                
+            return self._dispatch(to, subject, body, html_body)
+            
         except Exception as e:
             logger.error(f"Error sending email: {e}")
             return False
             
+    def close(self) -> None:
+        """Close the SMTP connection, if one is open."""
+        lock = getattr(self, '_smtp_lock', None)
+        if lock is None:
+            return
+        with lock:
+            server, self._smtp = self._smtp, None
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+                
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Get the open SMTP connection, connecting and logging in on first use."""
+        if self._smtp is None:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+            try:
+                if self.smtp_use_tls:
+                    server.starttls()
+                server.login(self.smtp_username, self.smtp_password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+        
+    def _sendmail(self, recipients: List[str], data: bytes) -> None:
+        """Send on the shared connection, leaving it clean if the send fails."""
+        server = self._get_smtp()
+        try:
+            server.sendmail(self.from_email, recipients, data)
+        except smtplib.SMTPServerDisconnected:
+            self._smtp = None
+            server.close()
+            raise
+        except Exception:
+            # Abort the half-finished transaction so the next send starts
+            # fresh; if even that fails, reconnect on the next send
+            try:
+                server.rset()
+            except (smtplib.SMTPException, OSError):
+                self._smtp = None
+                server.close()
+            raise
+            
     def _send_smtp(
         self,
         to: Union[str, List[str]],
@@ -85,20 +182,27 @@ class Emailer:
             return False
             
         try:
-            msg = MIMEMultipart('alternative')
+            msg = EmailMessage(policy=policy.SMTP)
             msg['Subject'] = subject
             msg['From'] = self.from_email
             msg['To'] = to if isinstance(to, str) else ', '.join(to)
             
-            msg.attach(MIMEText(body, 'plain'))
+            msg.set_content(body)
             if html_body:
-                msg.attach(MIMEText(html_body, 'html'))
+                msg.add_alternative(html_body, subtype='html')
                 
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.smtp_use_tls:
-                    server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            # Flatten once to wire format; reused if the send has to be retried
+            buf = io.BytesIO()
+            BytesGenerator(buf, policy=policy.SMTP).flatten(msg)
+            data = buf.getvalue()
+            recipients = [to] if isinstance(to, str) else list(to)
+            
+            with self._smtp_lock:
+                try:
+                    self._sendmail(recipients, data)
+                except smtplib.SMTPServerDisconnected:
+                    # The server dropped the idle connection; reconnect once
+                    self._sendmail(recipients, data)
                 
             logger.info(f"Email sent successfully via SMTP to {to}")
             return True
@@ -129,7 +233,7 @@ class Emailer:
                 "html": html_body
             }
             
-            response = requests.post(
+            response = self._http.post(
                 url,
                 auth=("api", self.mailgun_api_key),
                 data=data,
@@ -175,7 +279,7 @@ class Emailer:
             if html_body:
                 data["content"].append({"type": "text/html", "value": html_body})
                 
-            response = requests.post(
+            response = self._http.post(
                 url,
                 headers={"Authorization": f"Bearer {self.sendgrid_api_key}"},
                 json=data,
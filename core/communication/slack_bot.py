@@ -1,20 +1,34 @@
 """Slack bot utility for sending messages and notifications."""
 
 import os
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 from loguru import logger
 from dotenv import load_dotenv
 
+@lru_cache(maxsize=1)
+def _webhook_url() -> Optional[str]:
+    """Load .env and read the Slack webhook URL, once per process."""
+    load_dotenv()
+    return os.getenv('SLACK_WEBHOOK_URL')
+
 class SlackBot:
     """Utility class for sending messages to Slack via webhooks."""
     
+    _ERR_PREFIX = "❌ *Error:*\n"
+    _OK_PREFIX = "✅ *Success:*\n"
+    
     def __init__(self):
-        load_dotenv()
-        self.webhook_url = os.getenv('SLACK_WEBHOOK_URL')
+        self.webhook_url = _webhook_url()
         if not self.webhook_url:
             logger.warning("SLACK_WEBHOOK_URL not found in environment variables")
             
+        # Keep-alive session so repeated notifications reuse the TLS connection
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+            
     def send_message(self, channel: str, message: str, thread_ts: Optional[str] = None) -> bool:
         """
         Send a message to a Slack channel.
@@ -42,7 +56,7 @@ class SlackBot:
             if thread_ts:
                 payload["thread_ts"] = thread_ts
                 
-            response = requests.post(
+            response = self._session.post(
                 self.webhook_url,
                 json=payload,
                 timeout=5
@@ -82,7 +96,7 @@ class SlackBot:
         Returns:
             str: Formatted error message
         """
-        return f"❌ *Error:*\n{error}"
+        return self._ERR_PREFIX + error
         
     def format_success(self, message: str) -> str:
         """
@@ -94,4 +108,4 @@ class SlackBot:
         Returns:
             str: Formatted success message
         """
-        return f"✅ *Success:*\n{message}" 
\ No newline at end of file
+        return self._OK_PREFIX + message 
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Configuration management for P.E.P.P.E.R."""
 
+import threading
+from functools import cached_property
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from pathlib import Path
 from loguru import logger
@@ -7,7 +9,7 @@ from loguru import logger
 # Type checking imports to avoid circular dependencies
 if TYPE_CHECKING:
     from .loader import ConfigLoader
-    from .validator import ConfigValidator
+    from .config_validator import ConfigValidator
     from .base import BaseAgentConfig, SystemConfig
     from .models import AGENT_CONFIG_TYPES
 
@@ -15,6 +17,9 @@ class Config:
     """Manages all configuration-related operations for P.E.P.P.E.R."""
     
     _instance = None
+    _initialized = False
+    # Guards singleton creation and first initialization
+    _lock = threading.Lock()
     
     def __new__(cls, config_dir: Optional[str] = None):
         """Create a singleton instance of the configuration manager.
@@ -26,7 +31,9 @@ class Config:
             Singleton instance of the Config class
         """
         if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(Config, cls).__new__(cls)
         return cls._instance
         
     def __init__(self, config_dir: Optional[str] = None):
@@ -35,11 +42,38 @@ class Config:
         Args:
             config_dir: Optional directory containing configuration files
         """
-        if not hasattr(self, "initialized"):
+        if Config._initialized:
+            return
+        with Config._lock:
+            if Config._initialized:
+                return
+            # The loader and validator touch the filesystem, so they are built on first use
             self.config_dir = Path(config_dir) if config_dir else Path("config")
-            self.config_loader = ConfigLoader(self.config_dir)
-            self.config_validator = ConfigValidator(self.config_dir)
-            self.initialized = True
+            Config._initialized = True
+            
+    @cached_property
+    def config_loader(self) -> 'ConfigLoader':
+        """Configuration loader, created on first use."""
+        with Config._lock:
+            # Another thread may have built it while we waited
+            loader = self.__dict__.get("config_loader")
+            if loader is None:
+                from .loader import ConfigLoader
+                # Publish it before releasing the lock; cached_property only
+                # stores the returned value afterwards, unlocked
+                loader = self.__dict__["config_loader"] = ConfigLoader(self.config_dir)
+            return loader
+            
+    @cached_property
+    def config_validator(self) -> 'ConfigValidator':
+        """Configuration validator, created on first use."""
+        with Config._lock:
+            # Another thread may have built it while we waited
+            validator = self.__dict__.get("config_validator")
+            if validator is None:
+                from .config_validator import ConfigValidator
+                validator = self.__dict__["config_validator"] = ConfigValidator(self.config_dir)
+            return validator
             
     def get_system_config(self) -> Optional[SystemConfig]:
         """Get system configuration.
@@ -103,6 +137,7 @@ class Config:
         Returns:
             True if in development mode, False otherwise
         """
+        # The loader computes these once per (re)load, so hot reloads show up
         return self.config_loader.is_development()
         
     def is_production(self) -> bool:
@@ -139,16 +174,18 @@ class Config:
         Returns:
             True if update succeeds, False otherwise
         """
-        if agent_type not in AGENT_CONFIG_TYPES:
+        from .models import AGENT_CONFIG_TYPES
+        agent_config_class = AGENT_CONFIG_TYPES.get(agent_type)
+        if agent_config_class is None:
             logger.error(f"Invalid agent type: {agent_type}")
             return False
             
         try:
             # Validate the new configuration
-            agent_config_class = AGENT_CONFIG_TYPES[agent_type]
             agent_config_class(**config)
             
             # Update the configuration
+            self.config_validator.invalidate()
             return self.config_loader.update_agent_config(agent_type, config)
         except Exception as e:
             logger.error(f"Failed to update agent config: {e}")
@@ -168,6 +205,7 @@ class Config:
             SystemConfig(**config)
             
             # Update the configuration
+            self.config_validator.invalidate()
             return self.config_loader.update_system_config(config)
         except Exception as e:
             logger.error(f"Failed to update system config: {e}")
@@ -188,6 +226,7 @@ class Config:
                 return False
                 
             # Update the configuration
+            self.config_validator.invalidate()
             return self.config_loader.update_environment_config(config)
         except Exception as e:
             logger.error(f"Failed to update environment config: {e}")
@@ -200,13 +239,9 @@ class Config:
             flags: New feature flag values
             
         Returns:
-            True if update succeeds, False otherwise
+            True if update succeeds, False otherwise (failures are logged by the loader)
         """
-        try:
-            return self.config_loader.update_feature_flags(flags)
-        except Exception as e:
-            logger.error(f"Failed to update feature flags: {e}")
-            return False
+        return self.config_loader.update_feature_flags(flags)
         
     def update_secret(self, secret_name: str, secret_value: str) -> bool:
         """Update a secret value.
@@ -216,37 +251,25 @@ class Config:
             secret_value: New value for the secret
             
         Returns:
-            True if update succeeds, False otherwise
+            True if update succeeds, False otherwise (failures are logged by the loader)
         """
-        try:
-            return self.config_loader.update_secret(secret_name, secret_value)
-        except Exception as e:
-            logger.error(f"Failed to update secret: {e}")
-            return False
+        return self.config_loader.update_secret(secret_name, secret_value)
         
     def backup_configs(self) -> bool:
         """Backup current configurations.
         
         Returns:
-            True if backup succeeds, False otherwise
+            True if backup succeeds, False otherwise (failures are logged by the loader)
         """
-        try:
-            return self.config_loader.backup_configs()
-        except Exception as e:
-            logger.error(f"Failed to backup configs: {e}")
-            return False
+        return self.config_loader.backup_configs()
         
     def restore_configs(self) -> bool:
         """Restore configurations from backup.
         
         Returns:
-            True if restore succeeds, False otherwise
+            True if restore succeeds, False otherwise (failures are logged by the loader)
         """
-        try:
-            return self.config_loader.restore_configs()
-        except Exception as e:
-            logger.error(f"Failed to restore configs: {e}")
-            return False
+        return self.config_loader.restore_configs()
         
     def validate_config(self, config: Dict[str, Any], config_type: str) -> bool:
         """Validate a configuration dictionary.
@@ -3,27 +3,185 @@
 import os
 import json
 import time
-from datetime import datetime
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import MISSING, asdict, dataclass, field, fields
+from functools import lru_cache, partialmethod
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 from loguru import logger
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, validator
+from ..json_utils import dump_json, load_json
 
 # Type checking imports to avoid circular dependencies
 if TYPE_CHECKING:
     from .base import BaseAgentConfig, SystemConfig
     from .models import AGENT_CONFIG_TYPES
 
-class ValidationCheckpoint(BaseModel):
-    """Represents a validation checkpoint for agent tasks."""
+# Number of validation results remembered per validator
+VALIDATION_CACHE_SIZE = 256
+
+# The checkpoint log is folded into the snapshot once it outgrows both of these
+WAL_COMPACT_RATIO = 2
+WAL_COMPACT_MIN_BYTES = 64 * 1024
+
+# Delay used to coalesce bursts of checkpoint changes into one log write
+CHECKPOINT_FLUSH_DELAY = 0.05
+
+# Agents allowed to approve checkpoints
+_VALID_APPROVAL_AGENTS = frozenset({"pm_agent", "orchestrator"})
+
+# Local-time ISO 8601 stamp recorded when a checkpoint is approved or rejected
+_APPROVAL_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Checkpoint log operations and the status each one sets
+_WAL_STATUS = {"approve": "approved", "reject": "rejected"}
+
+# Keys each environment config section must define
+_REQUIRED_PROJECT = frozenset({"name", "environment", "debug", "log_level"})
+_REQUIRED_CORE = frozenset({"secret_key", "api_key", "encryption_key", "jwt_secret"})
+_REQUIRED_GITHUB = frozenset({"access_token"})
+_REQUIRED_SLACK = frozenset({"bot_token", "signing_secret", "webhook_url"})
+_REQUIRED_OPENAI = frozenset({"api_key"})
+_REQUIRED_DB = frozenset({"host", "port", "name", "user", "password"})
+_REQUIRED_AGENT = frozenset({"type", "enabled", "metadata"})
+
+def _require_fields(section: Dict[str, Any], required: frozenset, name: str) -> Dict[str, Any]:
+    """Check that a config section defines every required key.
+    
+    Args:
+        section: Config section to check
+        required: Keys the section must contain
+        name: Section name used in the error message
+        
+    Returns:
+        The section, unchanged
+        
+    Raises:
+        ValueError: If any required key is missing
+    """
+    missing = required.difference(section)
+    if missing:
+        raise ValueError(f"Missing required fields in {name} config: {sorted(missing)}")
+    return section
+
+@lru_cache(maxsize=1)
+def _invalid_agent_type_message() -> str:
+    """Build the unknown-agent-type error once, listing the registered types."""
+    from .models import AGENT_CONFIG_TYPES
+    return f"Invalid agent type. Must be one of: {sorted(AGENT_CONFIG_TYPES)}"
+
+def _config_key(config: Dict[str, Any]) -> Optional[str]:
+    """Build a stable cache key for a configuration dictionary.
+    
+    Returns None when the config cannot be serialized deterministically.
+    """
+    try:
+        return json.dumps(config, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+
+@dataclass(slots=True)
+class ValidationCheckpoint:
+    """Represents a validation checkpoint for agent tasks.
+    
+    A plain slotted dataclass rather than a pydantic model: every checkpoint
+    stays in memory for the validator's lifetime, and the values come from
+    our own code or our own checkpoint files.
+    """
     checkpoint_id: str
     agent_id: str
     task_id: str
-    status: str = Field(default="pending")  # pending, approved, rejected
+    status: str = "pending"  # pending, approved, rejected
     approved_by: Optional[str] = None
     approval_time: Optional[str] = None
-    validation_rules: Dict[str, Any] = Field(default_factory=dict)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    validation_rules: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def dict(self, exclude_defaults: bool = False, exclude_none: bool = False) -> Dict[str, Any]:
+        """Return the checkpoint as a dictionary.
+        
+        Args:
+            exclude_defaults: Leave out fields still at their default value
+            exclude_none: Leave out fields that are None
+            
+        Returns:
+            Dictionary of checkpoint fields
+        """
+        data = asdict(self)
+        if exclude_defaults or exclude_none:
+            for f in fields(self):
+                value = data[f.name]
+                if exclude_none and value is None:
+                    del data[f.name]
+                elif exclude_defaults and (
+                    (f.default is not MISSING and value == f.default)
+                    or (f.default_factory is not MISSING and value == f.default_factory())
+                ):
+                    del data[f.name]
+        return data
+
+class AgentSchema(BaseModel):
+    """Schema for agent configuration entries."""
+    type: str
+    enabled: bool
+    metadata: Dict[str, Any]
+    
+    @validator("type")
+    def validate_type(cls, v):
+        from .models import AGENT_CONFIG_TYPES
+        if v not in AGENT_CONFIG_TYPES:
+            raise ValueError(_invalid_agent_type_message())
+        return v
+    
+    @validator("metadata")
+    def validate_metadata(cls, v, values):
+        from .models import AGENT_CONFIG_TYPES
+        agent_config_class = AGENT_CONFIG_TYPES.get(values.get("type"))
+        if agent_config_class is not None:
+            # Validate against the specific agent config model
+            agent_config_class(**v)
+        return v
+
+class EnvironmentSchema(BaseModel):
+    """Schema for environment configuration files."""
+    project: Dict[str, Any]
+    core: Dict[str, Any]
+    github: Dict[str, Any]
+    slack: Dict[str, Any]
+    openai: Dict[str, Any]
+    database: Dict[str, Any]
+    docker: Dict[str, Any]
+    frontend: Dict[str, Any]
+    backend: Dict[str, Any]
+    monitoring: Dict[str, Any]
+    security: Dict[str, Any]
+    features: Dict[str, Any]
+    
+    @validator("project")
+    def validate_project(cls, v):
+        return _require_fields(v, _REQUIRED_PROJECT, "project")
+    
+    @validator("core")
+    def validate_core(cls, v):
+        return _require_fields(v, _REQUIRED_CORE, "core")
+    
+    @validator("github")
+    def validate_github(cls, v):
+        return _require_fields(v, _REQUIRED_GITHUB, "GitHub")
+    
+    @validator("slack")
+    def validate_slack(cls, v):
+        return _require_fields(v, _REQUIRED_SLACK, "Slack")
+    
+    @validator("openai")
+    def validate_openai(cls, v):
+        return _require_fields(v, _REQUIRED_OPENAI, "OpenAI")
+    
+    @validator("database")
+    def validate_database(cls, v):
+        return _require_fields(v, _REQUIRED_DB, "database")
 
 class ConfigValidator:
     """Validates configurations for P.E.P.P.E.R."""
@@ -36,8 +194,29 @@ class ConfigValidator:
         """
         self.config_dir = config_dir or Path("config")
         self.checkpoints: Dict[str, ValidationCheckpoint] = {}
+        # (config_type, config key) -> validation errors, least recently used first
+        self._validation_cache: "OrderedDict[Tuple[str, str], Tuple[str, ...]]" = OrderedDict()
+        # Set when the log holds changes not yet in the snapshot
+        self._dirty = False
+        # Snapshot of all checkpoints, and the temp file it is staged in
+        self._checkpoint_file = self.config_dir / "checkpoints.json"
+        self._checkpoint_tmp = self.config_dir / "checkpoints.json.tmp"
+        # Append-only log of checkpoint changes since the last snapshot
+        self._wal_path = self.config_dir / "checkpoints.wal"
+        self._wal_fd: Optional[int] = None
+        self._wal_size = 0
+        self._snapshot_size = 0
+        # Encoded log entries waiting for the background flusher
+        self._pending: List[bytes] = []
+        # Guards checkpoints, pending entries, the files and the validation cache
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
         self._load_schemas()
         self._load_checkpoints()
+        # Closes at interpreter exit without keeping the validator alive until then
+        self._finalizer = weakref.finalize(self, self._finalize, weakref.ref(self), self._wake)
         
     def _load_schemas(self) -> None:
         """Load validation schemas."""
@@ -49,148 +228,122 @@ class ConfigValidator:
         
     def _create_agent_schema(self) -> BaseModel:
         """Create agent configuration schema."""
-        class AgentSchema(BaseModel):
-            type: str
-            enabled: bool
-            metadata: Dict[str, Any]
-            
-            @validator("type")
-            def validate_type(cls, v):
-                if v not in AGENT_CONFIG_TYPES:
-                    raise ValueError(f"Invalid agent type. Must be one of: {list(AGENT_CONFIG_TYPES.keys())}")
-                return v
-                
-            @validator("metadata")
-            def validate_metadata(cls, v, values):
-                agent_type = values.get("type")
-                if agent_type in AGENT_CONFIG_TYPES:
-                    agent_config_class = AGENT_CONFIG_TYPES[agent_type]
-                    # Validate against the specific agent config model
-                    agent_config_class(**v)
-                return v
-                
         return AgentSchema
         
     def _create_system_schema(self) -> BaseModel:
         """Create system configuration schema."""
+        from .base import SystemConfig
         return SystemConfig
         
     def _create_environment_schema(self) -> BaseModel:
         """Create environment configuration schema."""
-        class EnvironmentSchema(BaseModel):
-            project: Dict[str, Any]
-            core: Dict[str, Any]
-            github: Dict[str, Any]
-            slack: Dict[str, Any]
-            openai: Dict[str, Any]
-            database: Dict[str, Any]
-            docker: Dict[str, Any]
-            frontend: Dict[str, Any]
-            backend: Dict[str, Any]
-            monitoring: Dict[str, Any]
-            security: Dict[str, Any]
-            features: Dict[str, Any]
-            
-            @validator("project")
-            def validate_project(cls, v):
-                required_fields = ["name", "environment", "debug", "log_level"]
-                for field in required_fields:
-                    if field not in v:
-                        raise ValueError(f"Missing required field in project config: {field}")
-                return v
-                
-            @validator("core")
-            def validate_core(cls, v):
-                required_fields = ["secret_key", "api_key", "encryption_key", "jwt_secret"]
-                for field in required_fields:
-                    if field not in v:
-                        raise ValueError(f"Missing required field in core config: {field}")
-                return v
-                
-            @validator("github")
-            def validate_github(cls, v):
-                if "access_token" not in v:
-                    raise ValueError("Missing required field in GitHub config: access_token")
-                return v
-                
-            @validator("slack")
-            def validate_slack(cls, v):
-                required_fields = ["bot_token", "signing_secret", "webhook_url"]
-                for field in required_fields:
-                    if field not in v:
-                        raise ValueError(f"Missing required field in Slack config: {field}")
-                return v
-                
-            @validator("openai")
-            def validate_openai(cls, v):
-                if "api_key" not in v:
-                    raise ValueError("Missing required field in OpenAI config: api_key")
-                return v
-                
-            @validator("database")
-            def validate_database(cls, v):
-                required_fields = ["host", "port", "name", "user", "password"]
-                for field in required_fields:
-                    if field not in v:
-                        raise ValueError(f"Missing required field in database config: {field}")
-                return v
-                
         return EnvironmentSchema
         
-    def validate_config(self, config: Dict[str, Any], config_type: str) -> bool:
-        """Validate a configuration dictionary.
+    def invalidate(self) -> None:
+        """Forget all memoized validation results."""
+        with self._lock:
+            self._validation_cache.clear()
+        
+    def _check_config(self, config: Dict[str, Any], config_type: str) -> Tuple[str, ...]:
+        """Run the schema for a configuration and collect its errors.
         
         Args:
             config: Configuration dictionary to validate
             config_type: Type of configuration to validate
             
         Returns:
-            True if validation succeeds, False otherwise
+            Tuple of validation error messages, empty if the config is valid
         """
         try:
+            if config_type == "agent":
+                self._check_agent_config(config)
+                return ()
+                
             if config_type not in self.schemas:
-                raise ValueError(f"Invalid configuration type: {config_type}")
+                return (f"Invalid configuration type: {config_type}",)
                 
             schema = self.schemas[config_type]
             schema(**config)
-            return True
+            return ()
         except Exception as e:
-            logger.error(f"Configuration validation failed: {e}")
-            return False
+            return (str(e),)
             
-    def validate_agent_config(self, config: Dict[str, Any]) -> bool:
-        """Validate an agent configuration.
+    def _check_agent_config(self, config: Dict[str, Any]) -> None:
+        """Validate an agent config entry directly against its agent model.
+        
+        Skips the AgentSchema wrapper so the agent fields are only walked once.
         
         Args:
-            config: Agent configuration to validate
+            config: Agent configuration entry to validate
             
-        Returns:
-            True if validation succeeds, False otherwise
+        Raises:
+            ValueError: If the entry is incomplete, mistyped or the agent type is unknown
         """
-        return self.validate_config(config, "agent")
-        
-    def validate_system_config(self, config: Dict[str, Any]) -> bool:
-        """Validate a system configuration.
+        from .models import AGENT_CONFIG_TYPES
+        _require_fields(config, _REQUIRED_AGENT, "agent")
+        # The checks AgentSchema made on the entry's own fields
+        if type(config["enabled"]) is not bool:
+            raise ValueError("Agent config field 'enabled' must be a boolean")
+        if not isinstance(config["metadata"], dict):
+            raise ValueError("Agent config field 'metadata' must be a mapping")
+        agent_config_class = AGENT_CONFIG_TYPES.get(config["type"])
+        if agent_config_class is None:
+            raise ValueError(_invalid_agent_type_message())
+        agent_config_class(**config["metadata"])
+            
+    def _cached_errors(self, config: Dict[str, Any], config_type: str) -> Tuple[str, ...]:
+        """Get validation errors, reusing the result for an identical config.
         
         Args:
-            config: System configuration to validate
+            config: Configuration dictionary to validate
+            config_type: Type of configuration to validate
             
         Returns:
-            True if validation succeeds, False otherwise
+            Tuple of validation error messages, empty if the config is valid
         """
-        return self.validate_config(config, "system")
+        key = _config_key(config)
+        if key is None:
+            return self._check_config(config, config_type)
+            
+        cache_key = (config_type, key)
+        cache = self._validation_cache
+        with self._lock:
+            errors = cache.get(cache_key)
+            if errors is not None:
+                cache.move_to_end(cache_key)
+                return errors
+                
+        # Validate outside the lock; a racing thread at worst repeats the work
+        errors = self._check_config(config, config_type)
+        with self._lock:
+            cache[cache_key] = errors
+            if len(cache) > VALIDATION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return errors
+        
+    def validate_config(self, config: Dict[str, Any], config_type: str) -> bool:
+        """Validate a configuration dictionary.
         
-    def validate_environment_config(self, config: Dict[str, Any]) -> bool:
-        """Validate an environment configuration.
+        Results are memoized, so re-validating an identical config is a lookup.
         
         Args:
-            config: Environment configuration to validate
+            config: Configuration dictionary to validate
+            config_type: Type of configuration to validate
             
         Returns:
             True if validation succeeds, False otherwise
         """
-        return self.validate_config(config, "environment")
-        
+        errors = self._cached_errors(config, config_type)
+        if errors:
+            logger.error(f"Configuration validation failed: {errors[0]}")
+            return False
+        return True
+            
+    # Typed shortcuts; partialmethod binds config_type without an extra Python frame
+    validate_agent_config = partialmethod(validate_config, config_type="agent")
+    validate_system_config = partialmethod(validate_config, config_type="system")
+    validate_environment_config = partialmethod(validate_config, config_type="environment")
+    
     def get_validation_errors(self, config: Dict[str, Any], config_type: str) -> List[str]:
         """Get validation errors for a configuration.
         
@@ -201,45 +354,197 @@ class ConfigValidator:
         Returns:
             List of validation error messages
         """
-        errors = []
-        try:
-            if config_type not in self.schemas:
-                errors.append(f"Invalid configuration type: {config_type}")
-                return errors
-                
-            schema = self.schemas[config_type]
-            schema(**config)
-        except Exception as e:
-            errors.append(str(e))
-            
-        return errors
+        return list(self._cached_errors(config, config_type))
 
     def _load_checkpoints(self) -> None:
-        """Load existing checkpoints from disk."""
-        checkpoint_file = self.config_dir / "checkpoints.json"
+        """Load the checkpoint snapshot from disk and replay the change log."""
+        checkpoint_file = self._checkpoint_file
         if checkpoint_file.exists():
             try:
-                with open(checkpoint_file, 'r') as f:
-                    data = json.load(f)
-                    self.checkpoints = {
-                        k: ValidationCheckpoint(**v) for k, v in data.items()
-                    }
+                raw = checkpoint_file.read_bytes()
+                data = load_json(raw)
+                self.checkpoints = {
+                    k: ValidationCheckpoint(**v) for k, v in data.items()
+                }
+                self._snapshot_size = len(raw)
             except Exception as e:
                 logger.error(f"Failed to load checkpoints: {e}")
                 
+        if self._wal_path.exists():
+            try:
+                raw = self._wal_path.read_bytes()
+                if raw and not raw.endswith(b"\n"):
+                    # A torn final write; cut it off so new entries start on a fresh line
+                    raw = raw[:raw.rfind(b"\n") + 1]
+                    os.truncate(self._wal_path, len(raw))
+                    logger.warning("Dropped a torn entry at the end of the checkpoint log")
+                self._replay_wal(raw)
+                self._wal_size = len(raw)
+                self._dirty = bool(raw)
+            except Exception as e:
+                logger.error(f"Failed to replay checkpoint log: {e}")
+                
+    def _replay_wal(self, data: bytes) -> None:
+        """Apply logged checkpoint changes on top of the loaded snapshot."""
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply_record(load_json(line))
+            except (ValueError, KeyError, TypeError) as e:
+                # One bad entry shouldn't cost every change logged after it
+                logger.warning(f"Skipping unreadable checkpoint log entry: {e}")
+            
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply a single checkpoint log entry."""
+        op = record["op"]
+        if op == "create":
+            self.checkpoints[record["id"]] = ValidationCheckpoint(**record["checkpoint"])
+            return
+            
+        # Read every field first so a malformed entry changes nothing
+        status, approved_by, approval_time = _WAL_STATUS[op], record["by"], record["t"]
+        checkpoint = self.checkpoints.get(record["id"])
+        if checkpoint is not None:
+            checkpoint.status = status
+            checkpoint.approved_by = approved_by
+            checkpoint.approval_time = approval_time
+            
+    def _get_wal_fd(self) -> int:
+        """Get the append-mode descriptor for the checkpoint log, opening it on first use."""
+        if self._wal_fd is None:
+            flags = (os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                     | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0))
+            self._wal_fd = os.open(self._wal_path, flags, 0o600)
+        return self._wal_fd
+        
+    def _append_wal(self, record: Dict[str, Any]) -> None:
+        """Queue one checkpoint change for the background flusher.
+        
+        Must be called with the lock held.
+        """
+        self._pending.append(dump_json(record, newline=True))
+        self._dirty = True
+        if self._closed:
+            # No flusher after close(); write straight through
+            self._write_pending()
+            return
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                args=(weakref.ref(self), self._wake),
+                name="checkpoint-flusher",
+                daemon=True
+            )
+            self._flusher.start()
+        self._wake.set()
+        
+    @staticmethod
+    def _flush_loop(ref: "weakref.ref[ConfigValidator]", wake: threading.Event) -> None:
+        """Write queued log entries, coalescing changes that arrive close together.
+        
+        The validator is only held while writing, so an unclosed one can
+        still be garbage collected.
+        """
+        while True:
+            wake.wait()
+            time.sleep(CHECKPOINT_FLUSH_DELAY)
+            wake.clear()
+            validator = ref()
+            if validator is None:
+                return
+            with validator._lock:
+                if validator._closed:
+                    return
+                validator._write_pending()
+                validator._maybe_compact()
+            del validator
+            
+    @staticmethod
+    def _finalize(ref: "weakref.ref[ConfigValidator]", wake: threading.Event) -> None:
+        """Close the validator if it is still alive, then let the flusher exit."""
+        validator = ref()
+        if validator is not None:
+            validator.close()
+        wake.set()
+                
+    def _write_pending(self) -> None:
+        """Append queued entries to the change log in a single write.
+        
+        Must be called with the lock held.
+        """
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        self._pending.clear()
+        try:
+            os.write(self._get_wal_fd(), data)
+            self._wal_size += len(data)
+        except Exception as e:
+            logger.error(f"Failed to log checkpoint changes: {e}")
+            
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the snapshot when the log outgrows it."""
+        if self._wal_size > max(WAL_COMPACT_RATIO * self._snapshot_size, WAL_COMPACT_MIN_BYTES):
+            self._save_checkpoints()
+            
     def _save_checkpoints(self) -> None:
-        """Save checkpoints to disk."""
-        checkpoint_file = self.config_dir / "checkpoints.json"
+        """Write a full checkpoint snapshot atomically and truncate the change log."""
         try:
-            with open(checkpoint_file, 'w') as f:
-                json.dump(
-                    {k: v.dict() for k, v in self.checkpoints.items()},
-                    f,
-                    indent=2
-                )
+            # Defaults are filled back in by ValidationCheckpoint on load
+            data = dump_json({
+                k: v.dict(exclude_defaults=True, exclude_none=True)
+                for k, v in self.checkpoints.items()
+            })
+            self._write_snapshot(self._checkpoint_tmp, data)
+            os.replace(self._checkpoint_tmp, self._checkpoint_file)
+            self._snapshot_size = len(data)
+            
+            # Only drop the log once the snapshot covering it is in place
+            if self._wal_fd is not None or self._wal_path.exists():
+                os.ftruncate(self._get_wal_fd(), 0)
+            self._pending.clear()
+            self._wal_size = 0
+            self._dirty = False
         except Exception as e:
             logger.error(f"Failed to save checkpoints: {e}")
             
+    @staticmethod
+    def _write_snapshot(path: Path, data: bytes) -> None:
+        """Write and sync a staged snapshot with raw descriptor calls.
+        
+        The snapshot is replaced rather than rewritten in place: the change
+        log is truncated right after, so a half-written snapshot would lose
+        checkpoints. Syncing first makes the replace safe to rely on.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+            
+    def flush(self) -> None:
+        """Fold queued and logged checkpoint changes into the snapshot, if there are any."""
+        with self._lock:
+            if self._dirty:
+                self._save_checkpoints()
+                
+    def close(self) -> None:
+        """Flush pending checkpoint changes, stop the flusher and close the change log."""
+        self._finalizer.detach()
+        with self._lock:
+            self._closed = True
+            if self._dirty:
+                self._save_checkpoints()
+            fd, self._wal_fd = self._wal_fd, None
+        self._wake.set()
+        if fd is not None:
+            os.close(fd)
+            
     def create_checkpoint(
         self,
         agent_id: str,
@@ -263,8 +568,13 @@ class ConfigValidator:
             task_id=task_id,
             validation_rules=validation_rules
         )
-        self.checkpoints[checkpoint_id] = checkpoint
-        self._save_checkpoints()
+        with self._lock:
+            self.checkpoints[checkpoint_id] = checkpoint
+            self._append_wal({
+                "op": "create",
+                "id": checkpoint_id,
+                "checkpoint": checkpoint.dict(exclude_defaults=True, exclude_none=True)
+            })
         return checkpoint_id
         
     def approve_checkpoint(self, checkpoint_id: str, approved_by: str) -> bool:
@@ -277,14 +587,20 @@ class ConfigValidator:
         Returns:
             True if approval succeeds, False otherwise
         """
-        if checkpoint_id not in self.checkpoints:
-            return False
-            
-        checkpoint = self.checkpoints[checkpoint_id]
-        checkpoint.status = "approved"
-        checkpoint.approved_by = approved_by
-        checkpoint.approval_time = datetime.now().isoformat()
-        self._save_checkpoints()
+        with self._lock:
+            checkpoint = self.checkpoints.get(checkpoint_id)
+            if checkpoint is None:
+                return False
+                
+            checkpoint.status = "approved"
+            checkpoint.approved_by = approved_by
+            checkpoint.approval_time = time.strftime(_APPROVAL_TIME_FORMAT)
+            self._append_wal({
+                "op": "approve",
+                "id": checkpoint_id,
+                "by": approved_by,
+                "t": checkpoint.approval_time
+            })
         return True
         
     def reject_checkpoint(self, checkpoint_id: str, approved_by: str) -> bool:
@@ -297,14 +613,20 @@ class ConfigValidator:
         Returns:
             True if rejection succeeds, False otherwise
         """
-        if checkpoint_id not in self.checkpoints:
-            return False
-            
-        checkpoint = self.checkpoints[checkpoint_id]
-        checkpoint.status = "rejected"
-        checkpoint.approved_by = approved_by
-        checkpoint.approval_time = datetime.now().isoformat()
-        self._save_checkpoints()
+        with self._lock:
+            checkpoint = self.checkpoints.get(checkpoint_id)
+            if checkpoint is None:
+                return False
+                
+            checkpoint.status = "rejected"
+            checkpoint.approved_by = approved_by
+            checkpoint.approval_time = time.strftime(_APPROVAL_TIME_FORMAT)
+            self._append_wal({
+                "op": "reject",
+                "id": checkpoint_id,
+                "by": approved_by,
+                "t": checkpoint.approval_time
+            })
         return True
         
     def get_checkpoint_status(self, checkpoint_id: str) -> Optional[str]:
@@ -330,7 +652,7 @@ class ConfigValidator:
         """
         try:
             throttle = config.get("build_throttle", 1.0)
-            if not isinstance(throttle, (int, float)) or throttle < 0.1 or throttle > 2.0:
+            if type(throttle) not in (int, float) or not 0.1 <= throttle <= 2.0:
                 raise ValueError(f"Invalid throttle value: {throttle}")
             return True
         except Exception as e:
@@ -353,7 +675,7 @@ class ConfigValidator:
             if requires_approval and not approval_agent:
                 raise ValueError("approval_agent must be specified when requires_approval is True")
                 
-            if approval_agent and approval_agent not in ["pm_agent", "orchestrator"]:
+            if approval_agent and approval_agent not in _VALID_APPROVAL_AGENTS:
                 raise ValueError(f"Invalid approval agent: {approval_agent}")
                 
             return True
@@ -1,23 +1,105 @@
 """Configuration loader for P.E.P.P.E.R."""
 
 import os
-import json
+import re
+import mmap
 import yaml
+import queue
 import shutil
-from typing import Dict, Any, Optional, Union, Type, TypeVar, List
+import hashlib
+import weakref
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Optional, Union, Type, TypeVar, List, Set, Tuple, TYPE_CHECKING
 from pathlib import Path
 from loguru import logger
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from dotenv import dotenv_values
 from datetime import datetime
 
 # Type checking imports to avoid circular dependencies
 from .base import BaseAgentConfig, SystemConfig
 from .validator import ConfigValidator
 from .models import AGENT_CONFIG_TYPES
+from ..json_utils import dump_json, load_json
+
+if TYPE_CHECKING:
+    from watchdog.observers import Observer
+
+# Prefer the libyaml-backed loader and dumper; fall back to the pure-Python ones when unavailable
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 
 T = TypeVar('T')
 
+# Upper bound on threads used to copy config files for backup and restore
+MAX_CONFIG_WORKERS = 8
+
+# Files at least this large are memory-mapped for hashing and parsing;
+# below it a plain read is cheaper than setting up the mapping
+MMAP_MIN_BYTES = 64 * 1024
+
+# Plain top-level "type: name" line of an agent file, read before deciding to parse it
+_AGENT_TYPE_LINE = re.compile(rb'^type:[ \t]*([\'"]?)([A-Za-z0-9_-]+)\1[ \t]*(?:#[^\r\n]*)?\r?$', re.MULTILINE)
+
+# Quiet period after the last file event before reloading; editors fire several per save
+RELOAD_DEBOUNCE = 0.1
+
+# JSON parse caches written next to flat YAML maps; not config sources themselves.
+# Secrets never get one, so they only ever live in the YAML file.
+_SIDECAR_NAMES = frozenset({'feature_flags.json'})
+
+def _yaml_files(directory: Path) -> List[str]:
+    """List the .yaml files in a directory with a single scandir pass.
+    
+    Args:
+        directory: Directory to scan
+        
+    Returns:
+        Paths of the YAML files, as strings
+    """
+    with os.scandir(directory) as entries:
+        return [e.path for e in entries if e.name.endswith('.yaml') and e.is_file()]
+
+def _sidecar_digest(raw: bytes) -> str:
+    """Digest of a flat YAML map's content, used to validate its JSON sidecar."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+def _run_writes(writes: 'queue.Queue[Optional[Callable[[], None]]]') -> None:
+    """Apply queued config file writes in order until a None sentinel arrives.
+    
+    Takes only the queue, so the writer thread never keeps a loader alive.
+    """
+    while True:
+        write = writes.get()
+        if write is None:
+            writes.task_done()
+            return
+        try:
+            write()
+        except Exception as e:
+            logger.error(f"Failed to write config file: {e}")
+        finally:
+            # Drop the write (and the loader it references) before blocking again
+            del write
+            writes.task_done()
+
+def _stop_writer(writes: 'queue.Queue[Optional[Callable[[], None]]]', thread: threading.Thread) -> None:
+    """Let a writer thread apply the writes already queued, then stop it."""
+    writes.put(None)
+    # The loader can be collected on the writer thread itself, when it drops
+    # the last write; the sentinel alone stops it then
+    if thread is not threading.current_thread():
+        thread.join()
+
+def _stop_observer(observer: 'Observer', handler: 'ConfigFileHandler') -> None:
+    """Stop a file watcher without letting a stuck thread hang shutdown."""
+    handler.cancel()
+    observer.stop()
+    observer.join(timeout=1.0)
+
 class ConfigFileHandler(FileSystemEventHandler):
     """Handler for config file changes."""
     
@@ -27,17 +109,68 @@ class ConfigFileHandler(FileSystemEventHandler):
         Args:
             loader: ConfigLoader instance to notify of changes
         """
-        self.loader = loader
+        # A proxy, so the running observer doesn't keep the loader alive
+        self.loader = weakref.proxy(loader)
+        # Paths changed since the last reload, and the timer that will reload them
+        self._pending: Set[str] = set()
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
         
     def on_modified(self, event):
         """Handle file modification events.
         
+        Events are coalesced: the reload runs once the files have been quiet
+        for RELOAD_DEBOUNCE seconds.
+        
         Args:
             event: File system event
         """
-        if not event.is_directory and event.src_path.endswith(('.yaml', '.yml', '.json')):
-            logger.info(f"Config file changed: {event.src_path}")
-            self.loader.reload_config()
+        if (not event.is_directory and event.src_path.endswith(('.yaml', '.yml', '.json'))
+                and os.path.basename(event.src_path) not in _SIDECAR_NAMES):
+            self._queue(event.src_path)
+                
+    def on_deleted(self, event):
+        """Handle file deletion events.
+        
+        Args:
+            event: File system event
+        """
+        if not event.is_directory and event.src_path.endswith(('.yaml', '.yml')):
+            self._queue(event.src_path)
+            
+    def _queue(self, path: str) -> None:
+        """Record a changed path and restart the quiet-period timer.
+        
+        Args:
+            path: Path of the changed file
+        """
+        with self._lock:
+            self._pending.add(path)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(RELOAD_DEBOUNCE, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+                
+    def _flush(self) -> None:
+        """Reload once for every change collected during the quiet period."""
+        with self._lock:
+            paths, self._pending = self._pending, set()
+            self._timer = None
+        if paths:
+            logger.info(f"Config files changed: {', '.join(sorted(paths))}")
+            try:
+                self.loader.reload_paths(paths)
+            except Exception as e:
+                logger.error(f"Failed to reload changed config files: {e}")
+            
+    def cancel(self) -> None:
+        """Drop any pending reload."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending.clear()
 
 class ConfigLoader:
     """Loads and manages configuration for P.E.P.P.E.R."""
@@ -62,11 +195,35 @@ class ConfigLoader:
         self.config: Dict[str, Any] = {}
         self.system_config: Optional[SystemConfig] = None
         self.agent_configs: Dict[str, BaseAgentConfig] = {}
+        # Agent config file -> agent_id it defines, so edits and deletions can be applied per file
+        self._agent_files: Dict[Path, str] = {}
         self.feature_flags: Dict[str, bool] = {}
         self.secrets: Dict[str, str] = {}
+        # Environment-derived flags, computed by _load_env on every (re)load
+        self._env: Dict[str, Any] = {}
+        
+        # path -> (content digest, parsed YAML / built model) from the last load
+        self._yaml_cache: Dict[Path, Tuple[bytes, Any]] = {}
+        self._model_cache: Dict[Path, Tuple[bytes, Any]] = {}
+        # get_all_configs() result; dropped whenever loaded config changes
+        self._all_configs_cache: Optional[Dict[str, Any]] = None
         
         self.validator = ConfigValidator(self.config_dir)
         self.observer = None
+        self._handler: Optional[ConfigFileHandler] = None
+        # Stops the observer once, from stop_watching, garbage collection or exit
+        self._finalizer: Optional[weakref.finalize] = None
+        self._agents_watched = False
+        # Directories whose entries were replaced since the last flush()
+        self._dirty_dirs: Set[Path] = set()
+        # Runs backup/restore copies, which release the GIL in file I/O; created on first use
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # File writes from update_*, applied in order by a single writer thread
+        self._write_q: 'queue.Queue[Optional[Callable[[], None]]]' = queue.Queue()
+        # Stops the writer thread once, from stop_watching, garbage collection
+        # or exit; the writer is started on the first queued write
+        self._writer: Optional[weakref.finalize] = None
+        self._writer_lock = threading.Lock()
         
         self.load_config()
         if watch_changes:
@@ -74,6 +231,7 @@ class ConfigLoader:
             
     def load_config(self) -> None:
         """Load all configuration files."""
+        self._all_configs_cache = None
         try:
             # Load environment variables
             self._load_env()
@@ -95,54 +253,322 @@ class ConfigLoader:
             logger.error(f"Failed to load configuration: {e}")
             raise
             
+    def _read_yaml(self, path: Path, agent_types: Optional[Dict[str, Any]] = None) -> Tuple[bytes, Any]:
+        """Read a YAML file, reusing the parsed result if its content is unchanged.
+        
+        Args:
+            path: Path to the YAML file
+            agent_types: For agent files, the known agent types. A file whose
+                type line names any other type is not parsed at all.
+            
+        Returns:
+            Tuple of the content digest and the parsed data. The data may be
+            shared with the cache, so callers must copy it before mutating.
+            For a skipped agent file the data is just {'type': <declared type>}.
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+                return self._parse_yaml(path, f.read(), agent_types)
+            # Hash and parse straight from the page cache instead of copying
+            # the whole file into a bytes object first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._parse_yaml(path, mm, agent_types)
+                
+    def _parse_yaml(
+        self,
+        path: Path,
+        data: Union[bytes, mmap.mmap],
+        agent_types: Optional[Dict[str, Any]] = None
+    ) -> Tuple[bytes, Any]:
+        """Hash raw YAML content and parse it unless the cached result still matches."""
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == digest:
+            return digest, cached[1]
+        if agent_types is not None:
+            # Quoting or flow styles the pattern misses just fall through to the full parse
+            match = _AGENT_TYPE_LINE.search(data)
+            if match is not None:
+                declared = match.group(2).decode()
+                if declared not in agent_types:
+                    return digest, {'type': declared}
+        parsed = yaml.load(data, Loader=YamlLoader)
+        self._yaml_cache[path] = (digest, parsed)
+        return digest, parsed
+        
+    def _cached_model(self, path: Path, digest: bytes, model_class: Type[T], data: Dict[str, Any]) -> T:
+        """Build a config model for a file, reusing the last one if the file is unchanged.
+        
+        Args:
+            path: Path the data was read from
+            digest: Content digest returned by _read_yaml
+            model_class: Config model to build
+            data: Parsed file contents
+            
+        Returns:
+            Config model instance
+        """
+        cached = self._model_cache.get(path)
+        if cached is not None and cached[0] == digest and type(cached[1]) is model_class:
+            return cached[1]
+        # Hand the dict straight to the compiled validator rather than
+        # unpacking it into keyword arguments
+        model = model_class.model_validate(data)
+        self._model_cache[path] = (digest, model)
+        return model
+        
     def _load_env(self) -> None:
         """Load environment variables."""
         if self.env_file.exists():
-            with open(self.env_file, 'r') as f:
-                for line in f:
-                    if line.strip() and not line.startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        os.environ[key] = value
+            # dotenv handles quoting, export prefixes and multiline values;
+            # keys given without a value come back as None and are skipped
+            os.environ.update(
+                (key, value)
+                for key, value in dotenv_values(self.env_file).items()
+                if value is not None
+            )
+                        
+        environment = os.environ.get('ENVIRONMENT', 'development').lower()
+        self._env = {
+            'is_development': environment == 'development',
+            'is_production': environment == 'production',
+            'is_debug': os.environ.get('DEBUG', 'false').lower() == 'true',
+            'log_level': os.environ.get('LOG_LEVEL', 'INFO')
+        }
                         
     def _load_system_config(self) -> None:
         """Load system configuration."""
         system_config_path = self.config_dir / 'system.yaml'
         if system_config_path.exists():
-            with open(system_config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
-                self.system_config = SystemConfig(**config_data)
+            digest, config_data = self._read_yaml(system_config_path)
+            self.system_config = self._cached_model(system_config_path, digest, SystemConfig, config_data)
                 
     def _load_agent_configs(self) -> None:
         """Load agent configurations."""
         agents_dir = self.config_dir / 'agents'
         if agents_dir.exists():
-            for config_file in agents_dir.glob('*.yaml'):
-                try:
-                    with open(config_file, 'r') as f:
-                        config_data = yaml.safe_load(f)
-                        agent_type = config_data.get('type')
-                        if agent_type in AGENT_CONFIG_TYPES:
-                            agent_config_class = AGENT_CONFIG_TYPES[agent_type]
-                            agent_config = agent_config_class(**config_data)
-                            self.agent_configs[agent_config.agent_id] = agent_config
-                        else:
-                            logger.warning(f"Unknown agent type in {config_file}: {agent_type}")
-                except Exception as e:
-                    logger.error(f"Failed to load agent config {config_file}: {e}")
-                    
+            # Parsed on this thread: PyYAML's C parser and pydantic both hold
+            # the GIL, so a pool would only add overhead
+            for path in _yaml_files(agents_dir):
+                config_file = Path(path)
+                agent_config = self._load_agent_config_file(config_file)
+                if agent_config is not None:
+                    self._store_agent_config(config_file, agent_config)
+                        
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Get the config copy thread pool, creating it on first use."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=MAX_CONFIG_WORKERS,
+                thread_name_prefix='config-io'
+            )
+        return self._io_pool
+        
+    def _copy_files(self, files: List[str], destination: Path, atomic: bool = False) -> None:
+        """Copy files into a directory concurrently.
+        
+        Args:
+            files: Files to copy
+            destination: Directory to copy them into
+            atomic: Stage each copy and swap it in with os.replace, so readers
+                never see a partially copied file
+            
+        Raises:
+            OSError: If any copy fails
+        """
+        copy = self._replace_with_copy if atomic else shutil.copy2
+        # Consume the results so a failed copy raises here
+        for _ in self._get_io_pool().map(lambda file: copy(file, destination), files):
+            pass
+        if atomic:
+            self._dirty_dirs.add(destination)
+            
+    @staticmethod
+    def _replace_with_copy(file: str, destination: Path) -> None:
+        """Copy a file into a directory, atomically replacing any existing copy."""
+        target = destination / os.path.basename(file)
+        tmp_file = target.with_name(target.name + '.tmp')
+        shutil.copyfile(file, tmp_file)
+        # Get the copy's data on disk before it replaces the live file; the
+        # mode is copied afterwards so a read-only source can still be opened
+        with open(tmp_file, 'rb+') as f:
+            os.fsync(f.fileno())
+        shutil.copystat(file, tmp_file)
+        os.replace(tmp_file, target)
+        
+    def _atomic_yaml_dump(self, path: Path, data: Any) -> None:
+        """Write YAML to a temp file and swap it into place.
+        
+        The data is synced before the rename, so a crash leaves either the
+        previous file or the new one, never a truncated file. Syncing the
+        directory entry is batched into flush().
+        
+        Args:
+            path: File to write
+            data: Data to dump
+        """
+        tmp_file = path.with_name(path.name + '.tmp')
+        with open(tmp_file, 'w') as f:
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+        self._dirty_dirs.add(path.parent)
+        
+    def _queue_write(self, write: Callable[[], None]) -> None:
+        """Schedule a config file write on the writer thread, starting it if needed."""
+        with self._writer_lock:
+            if self._writer is None:
+                thread = threading.Thread(target=_run_writes, args=(self._write_q,), name='config-writer', daemon=True)
+                thread.start()
+                self._writer = weakref.finalize(self, _stop_writer, self._write_q, thread)
+            self._write_q.put(write)
+            
+    def _stop_writes(self) -> None:
+        """Apply the queued writes and stop the writer thread."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer()
+        
+    def _save_flat_map(self, config_file: Path, data: Dict[str, Any]) -> None:
+        """Write a flat YAML map and refresh its JSON sidecar."""
+        self._atomic_yaml_dump(config_file, data)
+        self._write_sidecar(config_file.with_suffix('.json'), data, config_file, config_file.read_bytes())
+        
+    def flush_writes(self) -> None:
+        """Block until every queued config file write has been applied."""
+        self._write_q.join()
+        
+    def flush(self) -> None:
+        """Apply queued writes, then sync each directory they touched, once."""
+        self.flush_writes()
+        dirs, self._dirty_dirs = self._dirty_dirs, set()
+        for directory in dirs:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                # Directories can't be opened for syncing on every platform
+                continue
+            try:
+                os.fsync(fd)
+            except OSError as e:
+                logger.warning(f"Failed to sync config directory {directory}: {e}")
+            finally:
+                os.close(fd)
+            
+    def _load_single_agent(self, config_file: Path) -> None:
+        """Reload one agent configuration file, or drop its agent if the file is gone.
+        
+        Args:
+            config_file: Path to the agent YAML file
+        """
+        if not config_file.exists():
+            agent_id = self._agent_files.pop(config_file, None)
+            if agent_id is not None:
+                self.agent_configs.pop(agent_id, None)
+                logger.info(f"Removed agent config {agent_id}: {config_file} was deleted")
+            self._yaml_cache.pop(config_file, None)
+            self._model_cache.pop(config_file, None)
+            return
+            
+        agent_config = self._load_agent_config_file(config_file)
+        if agent_config is not None:
+            self._store_agent_config(config_file, agent_config)
+            
+    def _store_agent_config(self, config_file: Path, agent_config: BaseAgentConfig) -> None:
+        """Record an agent configuration loaded from a file.
+        
+        Args:
+            config_file: File the configuration came from
+            agent_config: Loaded agent configuration
+        """
+        old_id = self._agent_files.get(config_file)
+        if old_id is not None and old_id != agent_config.agent_id:
+            # The file now defines a different agent
+            self.agent_configs.pop(old_id, None)
+        self.agent_configs[agent_config.agent_id] = agent_config
+        self._agent_files[config_file] = agent_config.agent_id
+        
+    def _load_agent_config_file(self, config_file: Path) -> Optional[BaseAgentConfig]:
+        """Parse and validate a single agent configuration file.
+        
+        Args:
+            config_file: Path to the agent YAML file
+            
+        Returns:
+            Agent configuration if the file is valid, None otherwise
+        """
+        try:
+            digest, config_data = self._read_yaml(config_file, AGENT_CONFIG_TYPES)
+            agent_type = config_data.get('type')
+            agent_config_class = AGENT_CONFIG_TYPES.get(agent_type)
+            if agent_config_class is not None:
+                return self._cached_model(config_file, digest, agent_config_class, config_data)
+            logger.warning(f"Unknown agent type in {config_file}: {agent_type}")
+        except Exception as e:
+            logger.error(f"Failed to load agent config {config_file}: {e}")
+        return None
+        
+    def _load_flat_map(self, name: str) -> Optional[Dict[str, Any]]:
+        """Load a flat YAML map, preferring its JSON sidecar when it is current.
+        
+        The sidecar records a digest of the YAML content it was built from,
+        so any edit or restore of the YAML makes it stale and it is rebuilt
+        from the YAML, even when the mtime doesn't change.
+        
+        Args:
+            name: Base name of the file, without extension
+            
+        Returns:
+            The loaded map, or None if the YAML file does not exist
+        """
+        yaml_file = self.config_dir / f'{name}.yaml'
+        json_file = self.config_dir / f'{name}.json'
+        try:
+            raw = yaml_file.read_bytes()
+        except FileNotFoundError:
+            return None
+            
+        try:
+            sidecar = load_json(json_file.read_bytes())
+            if sidecar.get('digest') == _sidecar_digest(raw):
+                return sidecar['data']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+            
+        data = dict(self._parse_yaml(yaml_file, raw)[1] or {})
+        self._write_sidecar(json_file, data, yaml_file, raw)
+        return data
+        
+    def _write_sidecar(self, json_file: Path, data: Dict[str, Any], yaml_file: Path, raw: bytes) -> None:
+        """Atomically write a JSON sidecar tagged with its YAML content's digest.
+        
+        Args:
+            json_file: Path of the sidecar
+            data: Map to write
+            yaml_file: YAML file the data came from; its mode is copied
+            raw: Content of the YAML file
+        """
+        try:
+            tmp_file = json_file.with_name(json_file.name + '.tmp')
+            tmp_file.write_bytes(dump_json({'digest': _sidecar_digest(raw), 'data': data}))
+            shutil.copymode(yaml_file, tmp_file)
+            os.replace(tmp_file, json_file)
+        except Exception as e:
+            logger.warning(f"Failed to write config sidecar {json_file}: {e}")
+            
     def _load_feature_flags(self) -> None:
         """Load feature flags."""
-        flags_file = self.config_dir / 'feature_flags.yaml'
-        if flags_file.exists():
-            with open(flags_file, 'r') as f:
-                self.feature_flags = yaml.safe_load(f) or {}
+        flags = self._load_flat_map('feature_flags')
+        if flags is not None:
+            self.feature_flags = flags
                 
     def _load_secrets(self) -> None:
-        """Load secrets."""
+        """Load secrets straight from the YAML file; they get no sidecar."""
         secrets_file = self.config_dir / 'secrets.yaml'
         if secrets_file.exists():
-            with open(secrets_file, 'r') as f:
-                self.secrets = yaml.safe_load(f) or {}
+            self.secrets = dict(self._read_yaml(secrets_file)[1] or {})
                     
     def get_agent_config(self, agent_id: str) -> Optional[BaseAgentConfig]:
         """Get configuration for a specific agent.
@@ -208,7 +634,7 @@ class ConfigLoader:
         Returns:
             True if in development mode, False otherwise
         """
-        return os.getenv('ENVIRONMENT', 'development').lower() == 'development'
+        return self._env['is_development']
         
     def is_production(self) -> bool:
         """Check if running in production mode.
@@ -216,7 +642,7 @@ class ConfigLoader:
         Returns:
             True if in production mode, False otherwise
         """
-        return os.getenv('ENVIRONMENT', 'development').lower() == 'production'
+        return self._env['is_production']
         
     def is_debug(self) -> bool:
         """Check if debug mode is enabled.
@@ -224,7 +650,7 @@ class ConfigLoader:
         Returns:
             True if debug mode is enabled, False otherwise
         """
-        return os.getenv('DEBUG', 'false').lower() == 'true'
+        return self._env['is_debug']
         
     def get_log_level(self) -> str:
         """Get the configured log level.
@@ -232,7 +658,7 @@ class ConfigLoader:
         Returns:
             Configured log level
         """
-        return os.getenv('LOG_LEVEL', 'INFO')
+        return self._env['log_level']
         
     def update_agent_config(self, agent_type: str, config: Dict[str, Any]) -> bool:
         """Update configuration for a specific agent.
@@ -242,25 +668,26 @@ class ConfigLoader:
             config: New configuration values
             
         Returns:
-            True if update succeeds, False otherwise
+            True if the update is accepted, False otherwise. The file is
+            written in the background; call flush_writes() to wait for it.
         """
         try:
-            if agent_type not in AGENT_CONFIG_TYPES:
+            agent_config_class = AGENT_CONFIG_TYPES.get(agent_type)
+            if agent_config_class is None:
                 logger.error(f"Invalid agent type: {agent_type}")
                 return False
                 
-            agent_config_class = AGENT_CONFIG_TYPES[agent_type]
-            agent_config = agent_config_class(**config)
+            agent_config = agent_config_class.model_validate(config)
             
             # Save to file
             config_file = self.config_dir / 'agents' / f"{agent_type}.yaml"
             config_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            self._watch_agents_dir()
+            self._queue_write(lambda data=dict(config): self._atomic_yaml_dump(config_file, data))
                 
             # Update in memory
-            self.agent_configs[agent_config.agent_id] = agent_config
+            self._store_agent_config(config_file, agent_config)
+            self._all_configs_cache = None
             return True
         except Exception as e:
             logger.error(f"Failed to update agent config: {e}")
@@ -273,18 +700,19 @@ class ConfigLoader:
             config: New system configuration values
             
         Returns:
-            True if update succeeds, False otherwise
+            True if the update is accepted, False otherwise. The file is
+            written in the background; call flush_writes() to wait for it.
         """
         try:
-            system_config = SystemConfig(**config)
+            system_config = SystemConfig.model_validate(config)
             
             # Save to file
             config_file = self.config_dir / 'system.yaml'
-            with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            self._queue_write(lambda data=dict(config): self._atomic_yaml_dump(config_file, data))
                 
             # Update in memory
             self.system_config = system_config
+            self._all_configs_cache = None
             return True
         except Exception as e:
             logger.error(f"Failed to update system config: {e}")
@@ -297,13 +725,13 @@ class ConfigLoader:
             config: New environment configuration values
             
         Returns:
-            True if update succeeds, False otherwise
+            True if the update is accepted, False otherwise. The file is
+            written in the background; call flush_writes() to wait for it.
         """
         try:
             # Save to file
             config_file = self.config_dir / 'environment.yaml'
-            with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            self._queue_write(lambda data=dict(config): self._atomic_yaml_dump(config_file, data))
             return True
         except Exception as e:
             logger.error(f"Failed to update environment config: {e}")
@@ -316,16 +744,17 @@ class ConfigLoader:
             flags: New feature flag values
             
         Returns:
-            True if update succeeds, False otherwise
+            True if the update is accepted, False otherwise. The file is
+            written in the background; call flush_writes() to wait for it.
         """
         try:
             # Save to file
             config_file = self.config_dir / 'feature_flags.yaml'
-            with open(config_file, 'w') as f:
-                yaml.dump(flags, f, default_flow_style=False)
+            self._queue_write(lambda data=dict(flags): self._save_flat_map(config_file, data))
                 
             # Update in memory
             self.feature_flags = flags
+            self._all_configs_cache = None
             return True
         except Exception as e:
             logger.error(f"Failed to update feature flags: {e}")
@@ -339,14 +768,14 @@ class ConfigLoader:
             secret_value: New value for the secret
             
         Returns:
-            True if update succeeds, False otherwise
+            True if the update is accepted, False otherwise. The file is
+            written in the background; call flush_writes() to wait for it.
         """
         try:
             # Save to file
             config_file = self.config_dir / 'secrets.yaml'
             self.secrets[secret_name] = secret_value
-            with open(config_file, 'w') as f:
-                yaml.dump(self.secrets, f, default_flow_style=False)
+            self._queue_write(lambda data=dict(self.secrets): self._atomic_yaml_dump(config_file, data))
             return True
         except Exception as e:
             logger.error(f"Failed to update secret: {e}")
@@ -359,20 +788,22 @@ class ConfigLoader:
             True if backup succeeds, False otherwise
         """
         try:
+            # Back up what update_* last accepted, not what has reached disk so far
+            self.flush_writes()
             backup_dir = self.config_dir / 'backups' / datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_dir.mkdir(parents=True, exist_ok=True)
             
-            # Copy all config files
-            for file in self.config_dir.glob('*.yaml'):
-                shutil.copy2(file, backup_dir)
+            # Backups are real copies, not hard links: many editors rewrite
+            # files in place, which would change a linked backup too.
+            # shutil.copy2 already copies in-kernel.
+            self._copy_files(_yaml_files(self.config_dir), backup_dir)
                 
             # Copy agent configs
             agents_dir = self.config_dir / 'agents'
             if agents_dir.exists():
                 backup_agents_dir = backup_dir / 'agents'
                 backup_agents_dir.mkdir(exist_ok=True)
-                for file in agents_dir.glob('*.yaml'):
-                    shutil.copy2(file, backup_agents_dir)
+                self._copy_files(_yaml_files(agents_dir), backup_agents_dir)
                     
             return True
         except Exception as e:
@@ -386,30 +817,32 @@ class ConfigLoader:
             True if restore succeeds, False otherwise
         """
         try:
+            # Don't let a queued write land on top of the restored files
+            self.flush_writes()
             backup_dir = self.config_dir / 'backups'
             if not backup_dir.exists():
                 logger.error("No backup directory found")
                 return False
                 
-            # Get latest backup
-            backups = sorted(backup_dir.iterdir(), reverse=True)
-            if not backups:
+            # Get latest backup; names are timestamps, so they sort chronologically
+            with os.scandir(backup_dir) as entries:
+                latest = max((e.name for e in entries if e.is_dir()), default=None)
+            if latest is None:
                 logger.error("No backups found")
                 return False
                 
-            latest_backup = backups[0]
+            latest_backup = backup_dir / latest
             
             # Restore all config files
-            for file in latest_backup.glob('*.yaml'):
-                shutil.copy2(file, self.config_dir)
+            self._copy_files(_yaml_files(latest_backup), self.config_dir, atomic=True)
                 
             # Restore agent configs
             backup_agents_dir = latest_backup / 'agents'
             if backup_agents_dir.exists():
                 agents_dir = self.config_dir / 'agents'
                 agents_dir.mkdir(exist_ok=True)
-                for file in backup_agents_dir.glob('*.yaml'):
-                    shutil.copy2(file, agents_dir)
+                self._watch_agents_dir()
+                self._copy_files(_yaml_files(backup_agents_dir), agents_dir, atomic=True)
                     
             # Reload configurations
             self.load_config()
@@ -423,35 +856,93 @@ class ConfigLoader:
         logger.info("Reloading configuration...")
         self.load_config()
         
+    def reload_paths(self, paths: Iterable[Union[str, Path]]) -> None:
+        """Reload only the configuration files that changed.
+        
+        Files without a dedicated loader (environment.yaml, files outside
+        the config directory, ...) fall back to a full reload.
+        
+        Args:
+            paths: Changed or deleted configuration files
+        """
+        loaders = {
+            Path('system.yaml'): self._load_system_config,
+            Path('feature_flags.yaml'): self._load_feature_flags,
+            Path('secrets.yaml'): self._load_secrets
+        }
+        pending = []
+        for path in paths:
+            rel = Path(os.path.relpath(path, self.config_dir))
+            if rel in loaders:
+                pending.append(loaders[rel])
+            elif rel.parent == Path('agents') and rel.suffix == '.yaml':
+                pending.append(lambda config_file=self.config_dir / rel: self._load_single_agent(config_file))
+            else:
+                self.reload_config()
+                return
+                
+        logger.info(f"Reloading {len(pending)} changed configuration file(s)...")
+        self._all_configs_cache = None
+        for load in pending:
+            load()
+        
     def start_watching(self) -> None:
         """Start watching for configuration file changes."""
+        # Imported here: the observer pulls in platform watch backends that
+        # loaders created with watch_changes=False never use
+        from watchdog.observers import Observer
+        
         self.observer = Observer()
+        self._handler = ConfigFileHandler(self)
+        # Only the top level and agents/ hold live config; a recursive watch
+        # would also report every file written under backups/
         self.observer.schedule(
-            ConfigFileHandler(self),
+            self._handler,
             str(self.config_dir),
-            recursive=True
+            recursive=False
         )
+        self._agents_watched = False
+        self._watch_agents_dir()
         self.observer.start()
+        self._finalizer = weakref.finalize(self, _stop_observer, self.observer, self._handler)
         logger.info("Started watching for config changes")
         
+    def _watch_agents_dir(self) -> None:
+        """Add the agents directory to the watch once it exists."""
+        agents_dir = self.config_dir / 'agents'
+        if self.observer and not self._agents_watched and agents_dir.is_dir():
+            self.observer.schedule(self._handler, str(agents_dir), recursive=False)
+            self._agents_watched = True
+        
     def stop_watching(self) -> None:
-        """Stop watching for configuration file changes."""
-        if self.observer:
-            self.observer.stop()
-            self.observer.join()
+        """Stop watching for configuration file changes.
+        
+        Also stops the writer thread once the queued writes are applied;
+        a later update starts a new one.
+        """
+        self._stop_writes()
+        self.flush()
+        finalizer, self._finalizer = self._finalizer, None
+        if finalizer is not None and finalizer.alive:
+            finalizer()
             logger.info("Stopped watching for config changes")
+        # Release the copy threads; a later backup or restore recreates the pool
+        pool, self._io_pool = self._io_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
             
-    def __del__(self):
-        """Cleanup when the loader is destroyed."""
-        self.stop_watching()
-        
     def get_all_configs(self) -> Dict[str, Any]:
         """Get all configurations.
         
+        The result is cached until the configuration changes, so callers
+        must not mutate it.
+        
         Returns:
             Dictionary containing all configurations
         """
-        return {
+        if self._all_configs_cache is not None:
+            return self._all_configs_cache
+        self._all_configs_cache = {
             "system": self.system_config.dict() if self.system_config else None,
             "agents": {
                 agent_id: config.dict()
@@ -464,4 +955,5 @@ class ConfigLoader:
                 "debug": self.is_debug(),
                 "log_level": self.get_log_level()
             }
-        } 
\ No newline at end of file
+        }
+        return self._all_configs_cache
\ No newline at end of file
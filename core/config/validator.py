@@ -2,8 +2,9 @@
 
 import os
 import yaml
-import json
-from typing import Dict, Any, Optional, Union, List, Type
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Union, List, Type, Tuple
 from pathlib import Path
 from loguru import logger
 from pydantic import BaseModel, ValidationError, Field
@@ -11,6 +12,27 @@ from pydantic import BaseModel, ValidationError, Field
 # Type checking imports to avoid circular dependencies
 from .base import BaseAgentConfig, SystemConfig
 from .models import AGENT_CONFIG_TYPES
+from ..json_utils import load_json
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when unavailable
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Number of validated files remembered per validator
+FILE_CACHE_SIZE = 64
+
+# Allowed values and required keys of environment.yaml
+_VALID_ENVIRONMENTS = frozenset({'development', 'production', 'staging'})
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+_REQUIRED_ENVIRONMENT = frozenset({'environment', 'debug', 'log_level'})
+
+def _file_config_type(file_path: Path) -> str:
+    """Get the validate_config type for a config file from its location and name."""
+    if file_path.parent.name == 'agents':
+        return 'agent'
+    return file_path.stem
 
 class ValidationError(Exception):
     """Custom validation error with detailed information."""
@@ -37,6 +59,10 @@ class ConfigValidator:
         """
         self.config_dir = Path(config_dir)
         self.schema_cache: Dict[str, Dict[str, Any]] = {}
+        # (path, mtime_ns, size) of files that passed validation; an edit changes the key
+        self._file_cache: "OrderedDict[Tuple[str, int, int], bool]" = OrderedDict()
+        # validate_file may be called from several threads at once
+        self._file_cache_lock = threading.Lock()
         
     def validate_file(self, file_path: Union[str, Path]) -> bool:
         """Validate a configuration file.
@@ -51,25 +77,50 @@ class ConfigValidator:
             ValidationError: If validation fails with details
         """
         file_path = Path(file_path)
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
             raise ValidationError(f"File not found: {file_path}", [])
             
+        cache_key = (str(file_path), st.st_mtime_ns, st.st_size)
+        with self._file_cache_lock:
+            if cache_key in self._file_cache:
+                self._file_cache.move_to_end(cache_key)
+                return True
+            
+        config_type = _file_config_type(file_path)
         try:
-            with open(file_path, 'r') as f:
+            # Binary: libyaml and the JSON parsers all decode UTF-8 bytes themselves
+            with open(file_path, 'rb') as f:
                 if file_path.suffix in ('.yaml', '.yml'):
-                    config_data = yaml.safe_load(f)
+                    valid = self.validate_config(yaml.load(f, Loader=YamlLoader), config_type)
                 elif file_path.suffix == '.json':
-                    config_data = json.load(f)
+                    raw = f.read()
+                    if config_type == 'system':
+                        # pydantic-core parses and validates in one pass, with no dict in between
+                        SystemConfig.model_validate_json(raw)
+                        valid = True
+                    else:
+                        valid = self.validate_config(load_json(raw), config_type)
                 else:
                     raise ValidationError(
                         f"Unsupported file type: {file_path.suffix}",
                         [{"loc": ["file_type"], "msg": f"Unsupported file type: {file_path.suffix}"}]
                     )
-                    
-            return self.validate_config(config_data, file_path.name)
         except Exception as e:
             raise ValidationError(f"Failed to validate file {file_path}: {str(e)}", [])
             
+        with self._file_cache_lock:
+            self._file_cache[cache_key] = valid
+            if len(self._file_cache) > FILE_CACHE_SIZE:
+                self._file_cache.popitem(last=False)
+        return valid
+        
+    def clear_cache(self) -> None:
+        """Forget which files have already passed validation."""
+        with self._file_cache_lock:
+            self._file_cache.clear()
+            
     def validate_config(self, config_data: Dict[str, Any], config_type: str) -> bool:
         """Validate configuration data.
         
@@ -85,16 +136,16 @@ class ConfigValidator:
         """
         try:
             if config_type == 'system':
-                SystemConfig(**config_data)
+                SystemConfig.model_validate(config_data)
             elif config_type.startswith('agent'):
                 agent_type = config_data.get('type')
-                if agent_type not in AGENT_CONFIG_TYPES:
+                agent_config_class = AGENT_CONFIG_TYPES.get(agent_type)
+                if agent_config_class is None:
                     raise ValidationError(
                         f"Invalid agent type: {agent_type}",
                         [{"loc": ["type"], "msg": f"Invalid agent type: {agent_type}"}]
                     )
-                agent_config_class = AGENT_CONFIG_TYPES[agent_type]
-                agent_config_class(**config_data)
+                agent_config_class.model_validate(config_data)
             elif config_type == 'feature_flags':
                 self._validate_feature_flags(config_data)
             elif config_type == 'secrets':
@@ -173,15 +224,14 @@ class ConfigValidator:
         Raises:
             ValidationError: If validation fails
         """
-        required_fields = {'environment', 'debug', 'log_level'}
-        missing_fields = required_fields - set(env_config.keys())
+        missing_fields = _REQUIRED_ENVIRONMENT - env_config.keys()
         if missing_fields:
             raise ValidationError(
                 f"Missing required environment fields: {missing_fields}",
                 [{"loc": ["environment", field], "msg": f"Missing required field: {field}"} for field in missing_fields]
             )
             
-        if env_config['environment'] not in {'development', 'production', 'staging'}:
+        if env_config['environment'] not in _VALID_ENVIRONMENTS:
             raise ValidationError(
                 f"Invalid environment value: {env_config['environment']}",
                 [{"loc": ["environment", "environment"], "msg": "Environment must be one of: development, production, staging"}]
@@ -193,7 +243,7 @@ class ConfigValidator:
                 [{"loc": ["environment", "debug"], "msg": "Debug must be a boolean"}]
             )
             
-        if env_config['log_level'] not in {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}:
+        if env_config['log_level'] not in _VALID_LOG_LEVELS:
             raise ValidationError(
                 f"Invalid log level: {env_config['log_level']}",
                 [{"loc": ["environment", "log_level"], "msg": "Log level must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL"}]
@@ -208,33 +258,26 @@ class ConfigValidator:
         Raises:
             ValidationError: If any validation fails
         """
-        try:
-            # Validate system config
-            system_config_path = self.config_dir / 'system.yaml'
-            if system_config_path.exists():
-                self.validate_file(system_config_path)
-                
-            # Validate agent configs
-            agents_dir = self.config_dir / 'agents'
-            if agents_dir.exists():
-                for config_file in agents_dir.glob('*.yaml'):
-                    self.validate_file(config_file)
-                    
-            # Validate feature flags
-            flags_file = self.config_dir / 'feature_flags.yaml'
-            if flags_file.exists():
-                self.validate_file(flags_file)
-                
-            # Validate secrets
-            secrets_file = self.config_dir / 'secrets.yaml'
-            if secrets_file.exists():
-                self.validate_file(secrets_file)
-                
-            # Validate environment config
-            env_file = self.config_dir / 'environment.yaml'
-            if env_file.exists():
-                self.validate_file(env_file)
+        files: List[Path] = []
+        
+        # System config
+        system_config_path = self.config_dir / 'system.yaml'
+        if system_config_path.exists():
+            files.append(system_config_path)
+            
+        # Agent configs
+        agents_dir = self.config_dir / 'agents'
+        if agents_dir.exists():
+            files.extend(agents_dir.glob('*.yaml'))
+            
+        # Feature flags, secrets and environment config
+        for name in ('feature_flags.yaml', 'secrets.yaml', 'environment.yaml'):
+            config_file = self.config_dir / name
+            if config_file.exists():
+                files.append(config_file)
                 
+        try:
+            self._validate_files(files)
             return True
         except ValidationError as e:
             logger.error(f"Configuration validation failed: {e.message}")
@@ -242,6 +285,31 @@ class ConfigValidator:
                 logger.error(f"  - {error['loc']}: {error['msg']}")
             raise
             
+    def _validate_files(self, files: List[Path]) -> None:
+        """Validate several files and report every failure.
+        
+        Args:
+            files: Configuration files to validate
+            
+        Raises:
+            ValidationError: If any file fails; combines all failures
+        """
+        failures: List[ValidationError] = []
+        for config_file in files:
+            try:
+                self.validate_file(config_file)
+            except ValidationError as e:
+                failures.append(e)
+        if not failures:
+            return
+        if len(failures) == 1:
+            raise failures[0]
+        raise ValidationError(
+            f"{len(failures)} configuration files failed validation: "
+            + "; ".join(failure.message for failure in failures),
+            [error for failure in failures for error in failure.errors]
+        )
+        
     def get_schema(self, config_type: str) -> Dict[str, Any]:
         """Get JSON schema for a configuration type.
         
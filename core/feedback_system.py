@@ -2,18 +2,25 @@
 
 import os
 import json
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, Iterable, List, Optional, Set
 from datetime import datetime
 from loguru import logger
 from pydantic import BaseModel
 from core.agent_base import BaseAgent
 from core.communication import SecureCommunication
 from core.exceptions import FatalError
+from core.json_utils import dump_json, load_json
 import asyncio
 from pathlib import Path
 
-class TaskCompletion(BaseModel):
-    """Model for task completion data."""
+@dataclass(slots=True)
+class TaskCompletion:
+    """Task completion data.
+    
+    A plain slotted dataclass rather than a pydantic model: one is built for
+    every finished task, and the values come from our own code.
+    """
     task_id: str
     agent_id: str
     estimated_duration: float
@@ -24,6 +31,10 @@ class TaskCompletion(BaseModel):
     dependencies: List[str]
     success: bool
     notes: Optional[str] = None
+    
+    def dict(self) -> Dict[str, Any]:
+        """Return the completion as a dictionary."""
+        return asdict(self)
 
 class MilestoneStatus(BaseModel):
     """Model for milestone status."""
@@ -47,6 +58,15 @@ class FeedbackSystem:
         self.data_dir = Path("data/feedback")
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
+        # Completions submitted without waiting, recorded in batches by a background task
+        self._completion_queue: "asyncio.Queue[TaskCompletion]" = asyncio.Queue()
+        self._recorder: Optional[asyncio.Task] = None
+        
+        # agent_id -> running metrics summary, loaded from disk on first use
+        self._metrics_state: Dict[str, Dict[str, Any]] = {}
+        # IDs of successfully completed tasks; None until loaded from disk
+        self._completed_tasks: Optional[Set[str]] = None
+        
     async def initialize(self):
         """Initialize the feedback system."""
         # Load historical data
@@ -58,14 +78,7 @@ class FeedbackSystem:
             # Save completion data
             await self._save_completion_data(completion)
             
-            # Analyze completion data
-            analysis = await self._analyze_completion(completion)
-            
-            # Update agent performance metrics
-            await self._update_agent_metrics(completion.agent_id, analysis)
-            
-            # Check for milestone updates
-            await self._check_milestone_status(completion)
+            analysis = await self._process_completion(completion)
             
             return {
                 "status": "success",
@@ -77,6 +90,80 @@ class FeedbackSystem:
             logger.error(f"Failed to record task completion: {e}")
             raise
             
+    def submit_task_completion(self, completion: TaskCompletion) -> None:
+        """Queue task completion data to be recorded in the background.
+        
+        Unlike ``record_task_completion`` this returns immediately; failures
+        are logged rather than raised. Call ``close`` to wait for the queue.
+        """
+        self._completion_queue.put_nowait(completion)
+        if self._recorder is None:
+            self._recorder = asyncio.create_task(self._record_completions())
+            
+    async def close(self) -> None:
+        """Record any queued completions and stop the background recorder."""
+        if self._recorder is None:
+            return
+        await self._completion_queue.join()
+        self._recorder.cancel()
+        await asyncio.gather(self._recorder, return_exceptions=True)
+        self._recorder = None
+        
+    async def _record_completions(self) -> None:
+        """Drain the completion queue, saving each batch in one worker-thread hop."""
+        while True:
+            batch = [await self._completion_queue.get()]
+            while not self._completion_queue.empty():
+                batch.append(self._completion_queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._write_completions, self.data_dir, batch)
+                self._mark_completed(batch)
+                for completion in batch:
+                    try:
+                        await self._process_completion(completion)
+                    except Exception as e:
+                        logger.error(f"Failed to analyze task completion {completion.task_id}: {e}")
+            except Exception as e:
+                logger.error(f"Failed to record task completions: {e}")
+            finally:
+                for _ in batch:
+                    self._completion_queue.task_done()
+                    
+    async def _process_completion(self, completion: TaskCompletion) -> Dict[str, Any]:
+        """Analyze a saved completion and update metrics and milestones."""
+        # Analyze completion data
+        analysis = await self._analyze_completion(completion)
+        
+        # Update agent performance metrics
+        await self._update_agent_metrics(completion, analysis)
+        
+        # Check for milestone updates
+        await self._check_milestone_status(completion)
+        
+        return analysis
+        
+    @staticmethod
+    def _write_completions(data_dir: Path, completions: List[TaskCompletion]) -> None:
+        """Write one completion file per record."""
+        for completion in completions:
+            (data_dir / f"completion_{completion.task_id}.json").write_bytes(dump_json(completion, indent=True))
+            
+    def _mark_completed(self, completions: Iterable[TaskCompletion]) -> None:
+        """Apply saved completions to the completed task set, if it is loaded."""
+        if self._completed_tasks is None:
+            return
+        for completion in completions:
+            if completion.success:
+                self._completed_tasks.add(completion.task_id)
+            else:
+                self._completed_tasks.discard(completion.task_id)
+                
+    def _completed_task_ids(self) -> Set[str]:
+        """Get the IDs of completed tasks, scanning completion files only the first time."""
+        if self._completed_tasks is None:
+            self._completed_tasks = set(self._get_completed_tasks())
+        return self._completed_tasks
+        
     async def _analyze_completion(self, completion: TaskCompletion) -> Dict[str, Any]:
         """Analyze task completion data."""
         # Calculate accuracy metrics
@@ -132,47 +219,119 @@ class FeedbackSystem:
         recommendations = await self.llm.generate_text(prompt)
         return recommendations.split("\n")
         
-    async def _update_agent_metrics(self, agent_id: str, analysis: Dict[str, Any]):
-        """Update agent performance metrics."""
-        metrics_file = self.data_dir / f"agent_metrics_{agent_id}.json"
+    async def _update_agent_metrics(self, completion: TaskCompletion, analysis: Dict[str, Any]):
+        """Update agent performance metrics.
         
+        The full history is appended to ``agent_metrics_{agent_id}.jsonl``, one
+        event per task; ``agent_metrics_{agent_id}.json`` only holds running
+        totals, so neither write grows with the number of tasks. Use
+        get_agent_metrics() to read the history back.
+        """
+        agent_id = completion.agent_id
         try:
-            if metrics_file.exists():
-                with open(metrics_file, 'r') as f:
-                    metrics = json.load(f)
-            else:
-                metrics = {
-                    "total_tasks": 0,
-                    "average_accuracy": 0,
-                    "completion_times": [],
-                    "patterns": {}
-                }
+            metrics = self._metrics_state.get(agent_id)
+            if metrics is None:
+                metrics = self._metrics_state[agent_id] = self._load_agent_metrics(agent_id)
+                
+            # Append the event to the history
+            event = {
+                "timestamp": datetime.now().isoformat(),
+                "accuracy": analysis["accuracy_percentage"],
+                "duration": completion.actual_duration,
+                "patterns": analysis["patterns"]
+            }
+            with open(self.data_dir / f"agent_metrics_{agent_id}.jsonl", 'ab') as f:
+                f.write(dump_json(event, newline=True))
                 
-            # Update metrics
+            # Update running totals
             metrics["total_tasks"] += 1
-            metrics["average_accuracy"] = (
-                (metrics["average_accuracy"] * (metrics["total_tasks"] - 1) + 
-                 analysis["accuracy_percentage"]) / metrics["total_tasks"]
+            metrics["average_accuracy"] += (
+                (analysis["accuracy_percentage"] - metrics["average_accuracy"]) / metrics["total_tasks"]
             )
-            metrics["completion_times"].append({
-                "timestamp": datetime.now().isoformat(),
-                "accuracy": analysis["accuracy_percentage"]
-            })
-            
-            # Update patterns
-            for pattern, value in analysis["patterns"].items():
-                if pattern not in metrics["patterns"]:
-                    metrics["patterns"][pattern] = []
-                metrics["patterns"][pattern].append(value)
+            pattern_counts = metrics["pattern_counts"]
+            for pattern in analysis["patterns"]:
+                pattern_counts[pattern] = pattern_counts.get(pattern, 0) + 1
                 
-            # Save updated metrics
-            with open(metrics_file, 'w') as f:
-                json.dump(metrics, f, indent=2)
+            # Save updated summary
+            (self.data_dir / f"agent_metrics_{agent_id}.json").write_bytes(dump_json(metrics, indent=True))
                 
         except Exception as e:
             logger.error(f"Failed to update agent metrics: {e}")
             raise
             
+    def _load_agent_metrics(self, agent_id: str) -> Dict[str, Any]:
+        """Load an agent's metrics summary, or start a new one.
+        
+        A summary in the old format, which kept the whole history, has that
+        history moved into the event log and is rewritten as running totals.
+        """
+        metrics = {
+            "total_tasks": 0,
+            "average_accuracy": 0,
+            "pattern_counts": {}
+        }
+        metrics_file = self.data_dir / f"agent_metrics_{agent_id}.json"
+        if not metrics_file.exists():
+            return metrics
+            
+        saved = load_json(metrics_file.read_bytes())
+        metrics["total_tasks"] = saved.get("total_tasks", 0)
+        metrics["average_accuracy"] = saved.get("average_accuracy", 0)
+        metrics["pattern_counts"] = saved.get("pattern_counts", {})
+        if "completion_times" in saved:
+            # Old summaries appended one value per task to each pattern list
+            patterns = saved.get("patterns", {})
+            with open(self.data_dir / f"agent_metrics_{agent_id}.jsonl", 'ab') as f:
+                for i, entry in enumerate(saved["completion_times"]):
+                    event = dict(entry)
+                    event["patterns"] = {
+                        pattern: values[i] for pattern, values in patterns.items() if i < len(values)
+                    }
+                    f.write(dump_json(event, newline=True))
+            metrics["pattern_counts"] = {pattern: len(values) for pattern, values in patterns.items()}
+            metrics_file.write_bytes(dump_json(metrics, indent=True))
+        return metrics
+        
+    def get_agent_metrics(self, agent_id: str) -> Dict[str, Any]:
+        """Get an agent's performance metrics, including its full history.
+        
+        Args:
+            agent_id: ID of the agent
+            
+        Returns:
+            Dictionary with ``total_tasks`` and ``average_accuracy``, the
+            per-task ``completion_times`` (timestamp, accuracy and duration)
+            and every value recorded for each pattern under ``patterns``.
+            Empty if the agent has no metrics yet.
+        """
+        metrics = self._metrics_state.get(agent_id)
+        if metrics is None:
+            metrics = self._metrics_state[agent_id] = self._load_agent_metrics(agent_id)
+        if not metrics["total_tasks"]:
+            return {}
+            
+        completion_times: List[Dict[str, Any]] = []
+        patterns: Dict[str, List[Any]] = {}
+        history_file = self.data_dir / f"agent_metrics_{agent_id}.jsonl"
+        if history_file.exists():
+            with open(history_file, 'rb') as f:
+                for line in f:
+                    try:
+                        event = load_json(line)
+                    except ValueError:
+                        # A torn last line from an interrupted append
+                        continue
+                    for pattern, value in event.pop("patterns", {}).items():
+                        patterns.setdefault(pattern, []).append(value)
+                    completion_times.append(event)
+                    
+        return {
+            "total_tasks": metrics["total_tasks"],
+            "average_accuracy": metrics["average_accuracy"],
+            "completion_times": completion_times,
+            "patterns": patterns
+        }
+        
     async def _check_milestone_status(self, completion: TaskCompletion):
         """Check and update milestone status."""
         # Get milestone data
@@ -181,15 +340,14 @@ class FeedbackSystem:
             return
             
         try:
-            with open(milestone_file, 'r') as f:
-                milestones = json.load(f)
+            milestones = load_json(milestone_file.read_bytes())
                 
             # Find relevant milestone
             for milestone in milestones:
                 if completion.task_id in milestone["tasks"]:
                     # Update milestone progress
-                    completed_tasks = sum(1 for task in milestone["tasks"] 
-                                       if task in self._get_completed_tasks())
+                    completed = self._completed_task_ids()
+                    completed_tasks = sum(1 for task in milestone["tasks"] if task in completed)
                     progress = completed_tasks / len(milestone["tasks"])
                     
                     # Check for delays
@@ -203,8 +361,7 @@ class FeedbackSystem:
                         milestone["actual_completion"] = datetime.now().isoformat()
                         
                     # Save updated milestone data
-                    with open(milestone_file, 'w') as f:
-                        json.dump(milestones, f, indent=2)
+                    milestone_file.write_bytes(dump_json(milestones, indent=True))
                         
                     # Send milestone update to Slack
                     await self._send_milestone_update(milestone)
@@ -250,7 +407,7 @@ class FeedbackSystem:
         
         Status: {milestone['status'].title()}
         Progress: {milestone['progress']*100:.1f}%
-        Tasks Completed: {sum(1 for task in milestone['tasks'] if task in self._get_completed_tasks())}/{len(milestone['tasks'])}
+        Tasks Completed: {sum(1 for task in milestone['tasks'] if task in self._completed_task_ids())}/{len(milestone['tasks'])}
         
         {'⚠️ Delay Reason: ' + milestone['delay_reason'] if milestone.get('delay_reason') else ''}"""
         
@@ -298,20 +455,18 @@ class FeedbackSystem:
         completed_tasks = []
         for file in self.data_dir.glob("completion_*.json"):
             try:
-                with open(file, 'r') as f:
-                    completion = json.load(f)
-                    if completion.get("success"):
-                        completed_tasks.append(completion["task_id"])
+                completion = load_json(file.read_bytes())
+                if completion.get("success"):
+                    completed_tasks.append(completion["task_id"])
             except Exception as e:
                 logger.error(f"Failed to read completion file {file}: {e}")
         return completed_tasks
         
     async def _save_completion_data(self, completion: TaskCompletion):
         """Save task completion data."""
-        file_path = self.data_dir / f"completion_{completion.task_id}.json"
         try:
-            with open(file_path, 'w') as f:
-                json.dump(completion.dict(), f, indent=2, default=str)
+            self._write_completions(self.data_dir, [completion])
+            self._mark_completed([completion])
         except Exception as e:
             logger.error(f"Failed to save completion data: {e}")
             raise
@@ -327,14 +482,17 @@ class FeedbackSystem:
         try:
             # Load completion data
             for file in self.data_dir.glob("completion_*.json"):
-                with open(file, 'r') as f:
-                    historical_data["completions"].append(json.load(f))
+                historical_data["completions"].append(load_json(file.read_bytes()))
+            self._completed_tasks = {
+                completion["task_id"]
+                for completion in historical_data["completions"]
+                if completion.get("success")
+            }
                     
             # Load agent metrics
             for file in self.data_dir.glob("agent_metrics_*.json"):
                 agent_id = file.stem.replace("agent_metrics_", "")
-                with open(file, 'r') as f:
-                    historical_data["metrics"][agent_id] = json.load(f)
+                historical_data["metrics"][agent_id] = load_json(file.read_bytes())
                     
         except Exception as e:
             logger.error(f"Failed to load historical data: {e}")
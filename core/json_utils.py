@@ -0,0 +1,66 @@
+"""JSON encoding shared by P.E.P.P.E.R.'s data files and messages."""
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson handles natively for the stdlib encoder."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+def dump_json(obj: Any, indent: bool = False, newline: bool = False) -> bytes:
+    """Serialize a value to UTF-8 JSON bytes, with orjson when it is installed.
+
+    Datetimes, dataclasses and non-string dict keys are accepted either way,
+    and any other unknown type is written as its str().
+
+    Args:
+        obj: Value to serialize
+        indent: Indent by two spaces, for files people read
+        newline: Append a newline, for JSON Lines records
+
+    Returns:
+        The encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=str, option=option)
+
+    data = json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+        default=_default
+    ).encode("utf-8")
+    return data + b"\n" if newline else data
+
+def load_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text, with orjson when it is installed.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        The parsed value
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,246 @@
+"""Tests for the agent orchestrator's task scheduling."""
+
+import pytest
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+from core import agent_orchestrator
+from core.agent_orchestrator import AgentOrchestrator, RetryStrategy
+from core.exceptions import FatalError, TransientError
+from core.feedback_system import TaskCompletion
+
+# Upper bound on any single scheduling run; a hang fails the test instead of the suite
+RUN_TIMEOUT = 5
+
+@dataclass
+class SchedulerTask:
+    """Stand-in for the Task the scheduler builds for each run."""
+    task_id: str
+    task_type: str
+    description: str
+    metadata: Dict[str, Any]
+
+class StubConfigLoader:
+    """Config loader with nothing configured."""
+
+    def __init__(self, config_dir: Optional[str] = None):
+        self.config_dir = config_dir
+
+    def load_system_config(self) -> Dict[str, Any]:
+        return {}
+
+    def load_agent_configs(self) -> Dict[str, Any]:
+        return {}
+
+    def load_tasks(self) -> List[Dict[str, Any]]:
+        return []
+
+class StubFeedbackSystem:
+    """Feedback system that keeps submitted completions in memory."""
+
+    def __init__(self, *args):
+        self.completions: List[TaskCompletion] = []
+
+    def submit_task_completion(self, completion: TaskCompletion) -> None:
+        self.completions.append(completion)
+
+class RecordingAgent:
+    """Agent that logs when its tasks start and end and can fail on demand."""
+
+    def __init__(self, agent_id: str, log: List[Tuple[str, str]], delay: float = 0.01):
+        self.agent_id = agent_id
+        self.log = log
+        self.delay = delay
+        # task_id -> errors raised by its next runs, in order
+        self.failures: Dict[str, List[Exception]] = {}
+        self.calls: Counter = Counter()
+        self.active = 0
+        self.max_active = 0
+
+    async def run_task(self, task: SchedulerTask) -> Dict[str, Any]:
+        self.calls[task.task_id] += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.log.append(("start", task.task_id))
+        try:
+            await asyncio.sleep(self.delay)
+            errors = self.failures.get(task.task_id)
+            if errors:
+                raise errors.pop(0)
+            return {"status": "success"}
+        finally:
+            self.log.append(("end", task.task_id))
+            self.active -= 1
+
+@pytest.fixture
+def orchestrator(monkeypatch) -> AgentOrchestrator:
+    """Create an orchestrator with stubbed config, feedback and metrics."""
+    monkeypatch.setattr(agent_orchestrator, "ConfigLoader", StubConfigLoader, raising=False)
+    monkeypatch.setattr(agent_orchestrator, "TaskRouter", object, raising=False)
+    monkeypatch.setattr(agent_orchestrator, "FeedbackSystem", StubFeedbackSystem, raising=False)
+    monkeypatch.setattr(agent_orchestrator, "Task", SchedulerTask, raising=False)
+    monkeypatch.setattr(agent_orchestrator, "TaskCompletion", TaskCompletion, raising=False)
+    monkeypatch.setattr(agent_orchestrator, "record_metric", lambda **kwargs: None)
+    monkeypatch.setattr(AgentOrchestrator, "_setup_logging", lambda self: None)
+
+    orchestrator = AgentOrchestrator("config/project_config.yaml")
+    # Retry immediately so retry tests don't sleep
+    orchestrator.default_retry_strategy = RetryStrategy(base_delay=0, strategy="fixed")
+    return orchestrator
+
+@pytest.fixture
+def log() -> List[Tuple[str, str]]:
+    """Shared start/end log of every agent's task runs."""
+    return []
+
+def add_agent(orchestrator: AgentOrchestrator, agent_id: str, log: List[Tuple[str, str]],
+              delay: float = 0.01) -> RecordingAgent:
+    """Create a recording agent and register it with the orchestrator."""
+    agent = RecordingAgent(agent_id, log, delay)
+    orchestrator.agents[agent_id] = agent
+    return agent
+
+async def run_tasks(orchestrator: AgentOrchestrator) -> None:
+    """Process every queued task, failing if scheduling doesn't finish."""
+    await asyncio.wait_for(orchestrator.process_tasks(), RUN_TIMEOUT)
+
+@pytest.mark.asyncio
+async def test_tasks_run_in_dependency_order(orchestrator: AgentOrchestrator, log):
+    """Test that a task only starts after all of its dependencies ended."""
+    add_agent(orchestrator, "backend", log)
+    add_agent(orchestrator, "frontend", log)
+    await orchestrator.add_task("deploy", "backend", "deploy", "Deploy", ["api", "ui"])
+    await orchestrator.add_task("ui", "frontend", "build", "Build UI", ["api"])
+    await orchestrator.add_task("api", "backend", "build", "Build API")
+
+    await run_tasks(orchestrator)
+
+    assert not orchestrator.tasks
+    assert {task_id for task_id, task in orchestrator.completed_tasks.items()
+            if task.status == "completed"} == {"api", "ui", "deploy"}
+    assert log.index(("end", "api")) < log.index(("start", "ui"))
+    assert log.index(("end", "ui")) < log.index(("start", "deploy"))
+
+@pytest.mark.asyncio
+async def test_blocked_task_ends_processing(orchestrator: AgentOrchestrator, log):
+    """Test that a task waiting on an unknown dependency doesn't hang the loop."""
+    add_agent(orchestrator, "backend", log)
+    await orchestrator.add_task("api", "backend", "build", "Build API")
+    await orchestrator.add_task("deploy", "backend", "deploy", "Deploy", ["missing"])
+
+    await run_tasks(orchestrator)
+
+    assert orchestrator.completed_tasks["api"].status == "completed"
+    assert list(orchestrator.tasks) == ["deploy"]
+    assert orchestrator.tasks["deploy"].status == "pending"
+    assert ("start", "deploy") not in log
+
+@pytest.mark.asyncio
+async def test_failed_dependency_ends_processing(orchestrator: AgentOrchestrator, log):
+    """Test that a failed task still releases its dependents and the loop ends."""
+    backend = add_agent(orchestrator, "backend", log)
+    backend.failures["api"] = [FatalError("build broke")]
+    await orchestrator.add_task("api", "backend", "build", "Build API")
+    await orchestrator.add_task("deploy", "backend", "deploy", "Deploy", ["api"])
+
+    await run_tasks(orchestrator)
+
+    assert not orchestrator.tasks
+    assert orchestrator.completed_tasks["api"].status == "failed"
+    assert orchestrator.completed_tasks["api"].result["error_type"] == "fatal"
+    assert orchestrator.completed_tasks["deploy"].status == "completed"
+
+@pytest.mark.asyncio
+async def test_processing_waits_for_milestone_updates(orchestrator: AgentOrchestrator, log, monkeypatch):
+    """Test that the loop waits for bookkeeping done after a task leaves the queue."""
+    add_agent(orchestrator, "backend", log)
+    updated: List[str] = []
+
+    async def update_milestone_progress(milestone_id: str) -> None:
+        await asyncio.sleep(0.05)
+        updated.append(milestone_id)
+
+    monkeypatch.setattr(orchestrator, "_update_milestone_progress", update_milestone_progress)
+    await orchestrator.add_task("api", "backend", "build", "Build API", metadata={"milestone_id": "m1"})
+
+    await run_tasks(orchestrator)
+
+    assert updated == ["m1"]
+
+@pytest.mark.asyncio
+async def test_one_worker_per_agent(orchestrator: AgentOrchestrator, log):
+    """Test that agents run concurrently while each runs one task at a time."""
+    agents = [add_agent(orchestrator, agent_id, log, delay=0.05) for agent_id in ("backend", "frontend")]
+    for agent in agents:
+        for i in range(3):
+            await orchestrator.add_task(f"{agent.agent_id}-{i}", agent.agent_id, "build", "Build")
+
+    await run_tasks(orchestrator)
+
+    assert len(orchestrator.completed_tasks) == 6
+    assert all(agent.max_active == 1 for agent in agents)
+    # Both agents had a task in progress before either finished its first one
+    first_end = next(i for i, (event, _) in enumerate(log) if event == "end")
+    assert {task_id.split("-")[0] for event, task_id in log[:first_end]} == {"backend", "frontend"}
+    # Each agent ran its tasks in the order they became ready
+    for agent in agents:
+        starts = [task_id for event, task_id in log if event == "start" and task_id.startswith(agent.agent_id)]
+        assert starts == [f"{agent.agent_id}-{i}" for i in range(3)]
+
+@pytest.mark.asyncio
+async def test_transient_error_is_retried(orchestrator: AgentOrchestrator, log):
+    """Test that transient errors are retried until the task succeeds."""
+    agent = add_agent(orchestrator, "backend", log)
+    agent.failures["api"] = [TransientError("busy"), ConnectionError("reset")]
+    task = SchedulerTask("api", "backend", "Build API", {})
+
+    result = await orchestrator._execute_task_with_retry("backend", task)
+
+    assert result == {"status": "success"}
+    assert agent.calls["api"] == 3
+    assert len(orchestrator.feedback_system.completions) == 1
+
+@pytest.mark.asyncio
+async def test_retries_stop_at_error_budget(orchestrator: AgentOrchestrator, log):
+    """Test that retries stop once the error type's budget is used up."""
+    agent = add_agent(orchestrator, "backend", log)
+    agent.failures["api"] = [FileNotFoundError("gone")] * 5
+    task = SchedulerTask("api", "backend", "Build API", {})
+
+    result = await orchestrator._execute_task_with_retry("backend", task)
+
+    # FileNotFoundError allows one retry
+    assert result["error_type"] == "max_retries_exceeded"
+    assert result["attempts"] == 2
+    assert agent.calls["api"] == 2
+
+@pytest.mark.asyncio
+async def test_fatal_error_is_not_retried(orchestrator: AgentOrchestrator, log):
+    """Test that errors without a retry budget fail on the first attempt."""
+    agent = add_agent(orchestrator, "backend", log)
+    agent.failures["api"] = [FatalError("bad input")]
+    task = SchedulerTask("api", "backend", "Build API", {})
+
+    result = await orchestrator._execute_task_with_retry("backend", task)
+
+    assert result["error_type"] == "fatal"
+    assert result["attempts"] == 1
+    assert agent.calls["api"] == 1
+    assert not orchestrator.feedback_system.completions
+
+@pytest.mark.asyncio
+async def test_task_status_copy_is_deep(orchestrator: AgentOrchestrator):
+    """Test that changing a copied status leaves the task untouched."""
+    await orchestrator.add_task("api", "backend", "build", "Build API", ["db"], metadata={"tags": ["core"]})
+    orchestrator.tasks["api"].result = {"files": ["app.py"]}
+
+    status = orchestrator.get_task_status("api")
+    status["result"]["files"].append("extra.py")
+    status["metadata"]["tags"].append("extra")
+    status["dependencies"].append("extra")
+
+    assert orchestrator.tasks["api"].result == {"files": ["app.py"]}
+    assert orchestrator.tasks["api"].metadata["tags"] == ["core"]
+    assert orchestrator.tasks["api"].depends_on == ["db"]
+    assert orchestrator.get_task_status("api") == orchestrator.get_task_status("api", copy=False)
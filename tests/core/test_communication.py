@@ -0,0 +1,99 @@
+"""Tests for message encryption and signing in core.communication."""
+
+import pytest
+import base64
+from typing import Dict, Any
+from cryptography.exceptions import InvalidTag
+from core.communication import SecureCommunication, LOCAL_PREFIX, LOCAL_TAG_SIZE
+
+@pytest.fixture
+def secure_communication() -> SecureCommunication:
+    """Create a secure communication instance with a fixed passphrase."""
+    return SecureCommunication("test-key-123")
+
+@pytest.fixture
+def message() -> Dict[str, Any]:
+    """Create a test message."""
+    return {
+        "sender": "backend",
+        "receiver": "frontend",
+        "content": {"text": "Build finished", "score": 0.5},
+        "message_type": "status"
+    }
+
+def flip_byte(data: bytes, index: int) -> bytes:
+    """Return a copy of data with one byte changed."""
+    changed = bytearray(data)
+    changed[index] ^= 0x01
+    return bytes(changed)
+
+def test_encrypt_decrypt_round_trip(secure_communication: SecureCommunication, message: Dict[str, Any]):
+    """Test that an encrypted message decrypts to the original."""
+    encrypted = secure_communication.encrypt_message(message)
+
+    assert not encrypted.startswith(LOCAL_PREFIX)
+    assert b"Build finished" not in base64.b64decode(encrypted)
+    assert secure_communication.decrypt_message(encrypted) == message
+
+def test_encryption_uses_fresh_nonce(secure_communication: SecureCommunication, message: Dict[str, Any]):
+    """Test that encrypting the same message twice gives different ciphertexts."""
+    assert secure_communication.encrypt_message(message) != secure_communication.encrypt_message(message)
+
+def test_other_key_cannot_decrypt(secure_communication: SecureCommunication, message: Dict[str, Any]):
+    """Test that a message encrypted under one key is rejected under another."""
+    encrypted = secure_communication.encrypt_message(message)
+
+    with pytest.raises(InvalidTag):
+        SecureCommunication("other-key").decrypt_message(encrypted)
+
+@pytest.mark.parametrize("index", [0, 20, -1])
+def test_tampered_ciphertext_is_rejected(secure_communication: SecureCommunication, message: Dict[str, Any],
+                                         index: int):
+    """Test that changing the nonce, ciphertext or GCM tag fails decryption."""
+    encrypted = secure_communication.encrypt_message_bytes(message)
+
+    with pytest.raises(InvalidTag):
+        secure_communication.decrypt_message_bytes(flip_byte(encrypted, index))
+
+def test_signature_round_trip(secure_communication: SecureCommunication, message: Dict[str, Any]):
+    """Test that a signed message verifies regardless of key order."""
+    signature = secure_communication.sign_message(message)
+
+    assert secure_communication.verify_message(dict(reversed(list(message.items()))), signature)
+
+def test_tampered_signature_is_rejected(secure_communication: SecureCommunication, message: Dict[str, Any]):
+    """Test that a changed signature or message fails verification."""
+    signature = secure_communication.sign_message(message)
+    tampered_signature = base64.b64encode(flip_byte(base64.b64decode(signature), 0)).decode()
+
+    assert not secure_communication.verify_message(message, tampered_signature)
+    assert not secure_communication.verify_message({**message, "receiver": "database"}, signature)
+    assert not SecureCommunication("other-key").verify_message(message, signature)
+    assert not secure_communication.verify_message(message, "not base64!")
+
+def test_local_message_is_not_encrypted(secure_communication: SecureCommunication, message: Dict[str, Any]):
+    """Test that local messages carry plain JSON behind an HMAC tag."""
+    encrypted = secure_communication.encrypt_message(message, local=True)
+
+    assert encrypted.startswith(LOCAL_PREFIX)
+    data = base64.b64decode(encrypted[len(LOCAL_PREFIX):])
+    assert b"Build finished" in data[LOCAL_TAG_SIZE:]
+    assert secure_communication.decrypt_message(encrypted) == message
+
+@pytest.mark.parametrize("index", [0, LOCAL_TAG_SIZE + 1])
+def test_tampered_local_message_is_rejected(secure_communication: SecureCommunication, message: Dict[str, Any],
+                                            index: int):
+    """Test that changing a local message's tag or payload fails verification."""
+    encrypted = secure_communication.encrypt_message(message, local=True)
+    data = base64.b64decode(encrypted[len(LOCAL_PREFIX):])
+    tampered = LOCAL_PREFIX + base64.b64encode(flip_byte(data, index)).decode()
+
+    with pytest.raises(ValueError, match="Invalid local message tag"):
+        secure_communication.decrypt_message(tampered)
+
+def test_local_message_needs_same_key(secure_communication: SecureCommunication, message: Dict[str, Any]):
+    """Test that a local message from another key is rejected."""
+    encrypted = SecureCommunication("other-key").encrypt_message(message, local=True)
+
+    with pytest.raises(ValueError, match="Invalid local message tag"):
+        secure_communication.decrypt_message(encrypted)
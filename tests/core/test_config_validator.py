@@ -0,0 +1,141 @@
+"""Tests for configuration validation and checkpoint persistence."""
+
+import gc
+import pytest
+import weakref
+from pathlib import Path
+from typing import Generator, List
+from core.config import config_validator
+from core.config.config_validator import ConfigValidator
+
+@pytest.fixture
+def open_validators() -> Generator[List[ConfigValidator], None, None]:
+    """Track validators created by a test and close them afterwards."""
+    validators: List[ConfigValidator] = []
+    yield validators
+    for validator in validators:
+        validator.close()
+
+@pytest.fixture
+def make_validator(tmp_path: Path, open_validators: List[ConfigValidator]):
+    """Create validators that share one checkpoint directory."""
+    def make() -> ConfigValidator:
+        validator = ConfigValidator(tmp_path)
+        open_validators.append(validator)
+        return validator
+    return make
+
+def write_log(validator: ConfigValidator) -> None:
+    """Write queued log entries now instead of waiting for the flusher."""
+    with validator._lock:
+        validator._write_pending()
+
+def test_checkpoint_create_and_approve(make_validator):
+    """Test creating, approving and rejecting checkpoints."""
+    validator = make_validator()
+    first = validator.create_checkpoint("frontend", "task-1", {"max_errors": 0})
+    second = validator.create_checkpoint("backend", "task-2", {})
+
+    assert validator.get_checkpoint_status(first) == "pending"
+    assert validator.approve_checkpoint(first, "pm_agent")
+    assert validator.reject_checkpoint(second, "pm_agent")
+    assert not validator.approve_checkpoint("missing", "pm_agent")
+
+    assert validator.get_checkpoint_status(first) == "approved"
+    assert validator.get_checkpoint_status(second) == "rejected"
+    assert validator.checkpoints[first].approved_by == "pm_agent"
+
+def test_checkpoints_replayed_from_log(make_validator, tmp_path: Path):
+    """Test that logged changes survive a restart without a snapshot."""
+    validator = make_validator()
+    first = validator.create_checkpoint("frontend", "task-1", {"max_errors": 0})
+    second = validator.create_checkpoint("backend", "task-2", {})
+    validator.approve_checkpoint(first, "pm_agent")
+    write_log(validator)
+    assert not (tmp_path / "checkpoints.json").exists()
+
+    restarted = make_validator()
+    assert restarted.get_checkpoint_status(first) == "approved"
+    assert restarted.get_checkpoint_status(second) == "pending"
+    assert restarted.checkpoints[first].validation_rules == {"max_errors": 0}
+
+def test_torn_log_tail_is_dropped(make_validator, tmp_path: Path):
+    """Test that entries logged after a torn write are not lost."""
+    validator = make_validator()
+    checkpoint_id = validator.create_checkpoint("frontend", "task-1", {})
+    write_log(validator)
+    with open(tmp_path / "checkpoints.wal", "ab") as f:
+        f.write(b'{"op":"appr')
+
+    restarted = make_validator()
+    assert restarted.get_checkpoint_status(checkpoint_id) == "pending"
+    assert (tmp_path / "checkpoints.wal").read_bytes().endswith(b"\n")
+    restarted.approve_checkpoint(checkpoint_id, "pm_agent")
+    write_log(restarted)
+
+    assert make_validator().get_checkpoint_status(checkpoint_id) == "approved"
+
+def test_bad_log_entry_is_skipped(make_validator, tmp_path: Path):
+    """Test that a malformed entry doesn't stop the rest of the replay."""
+    validator = make_validator()
+    checkpoint_id = validator.create_checkpoint("frontend", "task-1", {})
+    write_log(validator)
+    with open(tmp_path / "checkpoints.wal", "ab") as f:
+        f.write(b'{"op":"approve","id":"' + checkpoint_id.encode() + b'"}\n')
+        f.write(b'{"op":"bogus","id":"' + checkpoint_id.encode() + b'","by":"x","t":"y"}\n')
+        f.write(b'{"op":"reject","id":"' + checkpoint_id.encode() + b'","by":"qa","t":"2024-01-01T00:00:00"}\n')
+
+    restarted = make_validator()
+    assert restarted.get_checkpoint_status(checkpoint_id) == "rejected"
+    assert restarted.checkpoints[checkpoint_id].approved_by == "qa"
+
+def test_log_compacted_into_snapshot(make_validator, tmp_path: Path, monkeypatch):
+    """Test that a long log is folded into the snapshot and truncated."""
+    monkeypatch.setattr(config_validator, "WAL_COMPACT_MIN_BYTES", 0)
+    validator = make_validator()
+    ids = [validator.create_checkpoint("qa", f"task-{i}", {}) for i in range(5)]
+    validator.approve_checkpoint(ids[0], "pm_agent")
+    with validator._lock:
+        validator._write_pending()
+        validator._maybe_compact()
+
+    assert (tmp_path / "checkpoints.json").exists()
+    assert (tmp_path / "checkpoints.wal").stat().st_size == 0
+
+    restarted = make_validator()
+    assert set(ids) <= restarted.checkpoints.keys()
+    assert restarted.get_checkpoint_status(ids[0]) == "approved"
+
+def test_close_writes_snapshot(make_validator, tmp_path: Path):
+    """Test that closing folds pending changes into the snapshot."""
+    validator = make_validator()
+    checkpoint_id = validator.create_checkpoint("docs", "task-1", {})
+    validator.approve_checkpoint(checkpoint_id, "pm_agent")
+    validator.close()
+
+    assert (tmp_path / "checkpoints.json").exists()
+    assert make_validator().get_checkpoint_status(checkpoint_id) == "approved"
+
+@pytest.mark.parametrize("field, value", [("enabled", "banana"), ("metadata", ["agent_id", "fe"])])
+def test_agent_entry_field_types(make_validator, field, value):
+    """Test that mistyped agent entry fields are rejected."""
+    validator = make_validator()
+    config = {"type": "frontend", "enabled": True, "metadata": {"agent_id": "fe"}}
+    config[field] = value
+
+    errors = validator.get_validation_errors(config, "agent")
+    assert errors and field in errors[0]
+
+def test_unclosed_validator_is_collected(tmp_path: Path):
+    """Test that a validator nobody closed can be collected and its flusher stops."""
+    validator = ConfigValidator(tmp_path)
+    validator.create_checkpoint("frontend", "task-1", {})
+    flusher = validator._flusher
+    ref = weakref.ref(validator)
+
+    del validator
+    gc.collect()
+
+    assert ref() is None
+    flusher.join(timeout=1)
+    assert not flusher.is_alive()